@@ -0,0 +1,49 @@
+-- Add normalized ID / contact number columns to the leads table
+-- Run this in Supabase SQL Editor BEFORE deploying the API version that writes them
+
+-- Canonical form used by the API: spaces, dashes and plus signs removed, lower-cased
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_name = 'leads'
+        AND column_name = 'normalized_id_number'
+    ) THEN
+        ALTER TABLE leads ADD COLUMN normalized_id_number TEXT;
+        RAISE NOTICE 'Added normalized_id_number column to leads table';
+    ELSE
+        RAISE NOTICE 'normalized_id_number column already exists in leads table';
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM information_schema.columns
+        WHERE table_name = 'leads'
+        AND column_name = 'normalized_contact_number'
+    ) THEN
+        ALTER TABLE leads ADD COLUMN normalized_contact_number TEXT;
+        RAISE NOTICE 'Added normalized_contact_number column to leads table';
+    ELSE
+        RAISE NOTICE 'normalized_contact_number column already exists in leads table';
+    END IF;
+END $$;
+
+-- Backfill existing rows
+UPDATE leads
+SET normalized_id_number = lower(translate(trim(id_number), ' -+', ''))
+WHERE normalized_id_number IS NULL AND id_number IS NOT NULL;
+
+UPDATE leads
+SET normalized_contact_number = lower(translate(trim(contact_number), ' -+', ''))
+WHERE normalized_contact_number IS NULL AND contact_number IS NOT NULL;
+
+-- Indexes for the duplicate-check equality lookups
+CREATE INDEX IF NOT EXISTS idx_leads_normalized_id_number ON leads(normalized_id_number);
+CREATE INDEX IF NOT EXISTS idx_leads_normalized_contact_number ON leads(normalized_contact_number);
+
+-- Verify the columns were added
+SELECT column_name, data_type, is_nullable
+FROM information_schema.columns
+WHERE table_name = 'leads'
+AND column_name IN ('normalized_id_number', 'normalized_contact_number');
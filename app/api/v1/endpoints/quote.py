@@ -12,8 +12,10 @@ from app.utils.exceptions import (
     QuoteAPIError,
     QuoteResponseError
 )
+import asyncio
 import httpx
 import logging
+import orjson
 from datetime import datetime
 from app.utils.rich_logger import get_rich_logger
 from config.settings import settings
@@ -39,15 +41,17 @@ async def create_quote(quote: QuoteRequest, background_tasks: BackgroundTasks):
         logger.info(f"🔍 [DEV] [REQUEST-{request_id}] Agent: {quote.agentEmail} | Branch: {quote.agentBranch}")
         logger.info(f"🔍 [DEV] [REQUEST-{request_id}] Vehicles count: {len(quote.vehicles)}")
 
-    # Use mode="json" to ensure date fields are serialized as strings
-    logger.info(f"Received quote request: {quote.model_dump(mode='json')}")
+    # Use mode="json" to ensure date fields are serialized as strings.
+    # Dump once and reuse it for the notification context below.
+    quote_dump = quote.model_dump(mode="json")
+    logger.info("Received quote request: %s", quote_dump)
     
     # Store the quote request
     if not settings.IS_PRODUCTION:
         logger.info(f"💾 [DEV] [REQUEST-{request_id}] Storing quote request")
     
     try:
-        created_doc = store_quote_request(quote)
+        created_doc = await asyncio.to_thread(store_quote_request, quote)
         doc_id = created_doc.get("id") if created_doc else None
         logger.info(f"Stored quote request with doc_id: {doc_id}")
         if not settings.IS_PRODUCTION:
@@ -63,7 +67,7 @@ async def create_quote(quote: QuoteRequest, background_tasks: BackgroundTasks):
         logger.info(f"🌍 [DEV] [REQUEST-{request_id}] Sending to Pineapple API: {settings.PINEAPPLE_QUOTE_API_URL}")
     
     pineapple_response = await send_quote_request(quote)
-    logger.debug(f"Raw response from Pineapple: {pineapple_response}")
+    logger.debug("Raw response from Pineapple: %s", pineapple_response)
     
     if isinstance(pineapple_response, dict) and "error" in pineapple_response:
         if not settings.IS_PRODUCTION:
@@ -80,14 +84,14 @@ async def create_quote(quote: QuoteRequest, background_tasks: BackgroundTasks):
 
         if isinstance(pineapple_response, httpx.Response):
             try:
-                pineapple_data_dict = pineapple_response.json()
-                logger.info(f"Parsed Pineapple response: {pineapple_data_dict}")
+                pineapple_data_dict = orjson.loads(pineapple_response.content)
+                logger.info("Parsed Pineapple response: %s", pineapple_data_dict)
             except Exception as e:
                 logger.error(f"Failed to decode Pineapple response as JSON: {str(e)}")
                 raise QuoteResponseError("Invalid JSON from Pineapple API")
         elif isinstance(pineapple_response, dict):
             pineapple_data_dict = pineapple_response
-            logger.info(f"Parsed Pineapple response: {pineapple_data_dict}")
+            logger.info("Parsed Pineapple response: %s", pineapple_data_dict)
         else:
             logger.error(
                 f"Unexpected type for pineapple_response: {type(pineapple_response)}. Expected httpx.Response or dict."
@@ -136,10 +140,10 @@ async def create_quote(quote: QuoteRequest, background_tasks: BackgroundTasks):
 
         # If we still can't find the premium, log the problem but continue with zeros
         if premium is None:
-            logger.warning(f"Could not find premium in response: {pineapple_data_dict}")
+            logger.warning("Could not find premium in response: %s", pineapple_data_dict)
             premium = 0
         if excess is None:
-            logger.warning(f"Could not find excess in response: {pineapple_data_dict}")
+            logger.warning("Could not find excess in response: %s", pineapple_data_dict)
             excess = 0
 
         # If quote_id is found, log it in dev mode
@@ -161,7 +165,7 @@ async def create_quote(quote: QuoteRequest, background_tasks: BackgroundTasks):
             logger.info(f"💾 [DEV] [REQUEST-{request_id}] Storing quote response...")
         
         if doc_id:
-            update_quote_response(doc_id, quote_response)
+            await asyncio.to_thread(update_quote_response, doc_id, quote_response)
             logger.info(f"Stored quote response for doc_id: {doc_id}")
         
         if not settings.IS_PRODUCTION:
@@ -185,18 +189,17 @@ async def create_quote(quote: QuoteRequest, background_tasks: BackgroundTasks):
         
         logger.info(f"📧 [REQUEST-{request_id}] Agent CC: {agent_email if agent_email else 'None'}")
         
-        # Add BCC if configured
-        bcc_emails = settings.ADMIN_BCC_EMAILS if hasattr(settings, 'ADMIN_BCC_EMAILS') and settings.ADMIN_BCC_EMAILS else None
+        bcc_emails = settings.ADMIN_BCC_EMAILS_LIST or None
         
         logger.info(f"📧 [REQUEST-{request_id}] Email recipients - TO: {settings.ADMIN_EMAILS}, BCC: {bcc_emails}")
         
         background_tasks.add_task(
-            email_service.send_email,
-            recipients=settings.ADMIN_EMAILS,  # Use settings directly instead of email_service.admin_emails
+            email_service.send_email_async,
+            recipients=settings.ADMIN_EMAILS_LIST,  # Use settings directly instead of email_service.admin_emails
             subject="New Quote Request Received",
             template_name="quote_notification.html",
             template_context={
-                "quote": quote.model_dump(mode="json"),
+                "quote": quote_dump,
                 "quote_response": {
                     "premium": premium,
                     "excess": excess,
@@ -252,7 +255,7 @@ async def get_quote(quote_id: str):
                 detail=f"Invalid quote ID format: {quote_id}"
             )
         
-        quote_document = get_quote_by_id(quote_id_int)
+        quote_document = await asyncio.to_thread(get_quote_by_id, quote_id_int)
         
         if not quote_document:
             if not settings.IS_PRODUCTION:
@@ -13,6 +13,7 @@ from app.utils.exceptions import (
     TransferAPIError,
     TransferResponseError
 )
+import asyncio
 import logging
 from datetime import datetime
 from config.settings import settings
@@ -81,32 +82,46 @@ async def create_transfer(
             source=source
         )
 
-    # Store the transfer request (with agent/branch info)
+    # Store the transfer request (with agent/branch info). The Pineapple payload
+    # doesn't depend on the stored row, so the insert runs while the API call is in flight.
     if not settings.IS_PRODUCTION:
         logger.info(f"💾 [DEV] [REQUEST-{request_id}] Storing transfer request in database...")
     
-    try:
-        created_doc = store_transfer_request(transfer_data=transfer)
-        doc_id = created_doc.get("id") if created_doc else None
-        if not settings.IS_PRODUCTION:
-            logger.info(f"✅ [DEV] [REQUEST-{request_id}] Transfer stored successfully with doc_id: {doc_id}")
-    except Exception as e:
-        if not settings.IS_PRODUCTION:
-            logger.error(f"❌ [DEV] [REQUEST-{request_id}] Failed to store transfer: {str(e)}")
-        logger.error(f"Failed to store transfer: {str(e)}")
-        raise TransferStorageError(str(e))
+    store_task = asyncio.create_task(
+        asyncio.to_thread(store_transfer_request, transfer_data=transfer)
+    )
 
     # Prepare ExTransferRequest for external API (includes agent_email & branch_name)
     if not settings.IS_PRODUCTION:
         logger.info(f"🔄 [DEV] [REQUEST-{request_id}] Preparing external API request...")
     
-    transfer_request = ExTransferRequest(customer_info=transfer.customer_info, agent_info=transfer.agent_info)
+    # Both parts were validated with the incoming request; skip re-validation
+    transfer_request = ExTransferRequest.model_construct(
+        customer_info=transfer.customer_info, agent_info=transfer.agent_info
+    )
 
     # Send the transfer request to Pineapple
     if not settings.IS_PRODUCTION:
         logger.info(f"🌍 [DEV] [REQUEST-{request_id}] Sending to Pineapple API: {settings.PINEAPPLE_TRANSFER_API_URL}")
     
-    pineapple_response = await send_transfer_request(transfer_request)
+    try:
+        pineapple_response = await send_transfer_request(transfer_request)
+    except BaseException:
+        # The insert runs in a worker thread and cannot be cancelled; let it
+        # finish so its outcome is settled before the error propagates
+        await asyncio.wait({store_task})
+        raise
+
+    store_error = None
+    try:
+        created_doc = await store_task
+    except Exception as e:
+        created_doc = None
+        store_error = e
+        logger.error(f"[REQUEST-{request_id}] Failed to store transfer before Pineapple replied: {str(e)}")
+    doc_id = created_doc.get("id") if created_doc else None
+    if doc_id and not settings.IS_PRODUCTION:
+        logger.info(f"✅ [DEV] [REQUEST-{request_id}] Transfer stored successfully with doc_id: {doc_id}")
     
     if isinstance(pineapple_response, dict) and "error" in pineapple_response:
         if not settings.IS_PRODUCTION:
@@ -124,28 +139,55 @@ async def create_transfer(
             if isinstance(pineapple_response, dict)
             else {}
         )
-        transfer_response = TransferResponse(
-            uuid=data.get("uuid", "") if isinstance(data, dict) else "",
-            redirect_url=data.get("redirect_url", "") if isinstance(data, dict) else "",
-        )
+        # Extract both fields with a single type check
+        if isinstance(data, dict):
+            uuid = data.get("uuid", "")
+            redirect_url = data.get("redirect_url", "")
+        else:
+            uuid = redirect_url = ""
+        transfer_response = TransferResponse(uuid=uuid, redirect_url=redirect_url)
         
         if not settings.IS_PRODUCTION:
             logger.info(f"📝 [DEV] [REQUEST-{request_id}] Parsed response - UUID: {transfer_response.uuid}")
             logger.info(f"📝 [DEV] [REQUEST-{request_id}] Redirect URL: {transfer_response.redirect_url}")
-        
-        # Store the transfer response
-        if doc_id:
-            update_transfer_response(doc_id, transfer_response)
-        
-        if not settings.IS_PRODUCTION:
-            logger.info(f"💾 [DEV] [REQUEST-{request_id}] Transfer response stored in database")
-            
     except Exception as e:
         if not settings.IS_PRODUCTION:
-            logger.error(f"❌ [DEV] [REQUEST-{request_id}] Failed to parse/store Pineapple response: {str(e)}")
-        logger.error(f"Failed to parse or store Pineapple transfer response: {str(e)}")
+            logger.error(f"❌ [DEV] [REQUEST-{request_id}] Failed to parse Pineapple response: {str(e)}")
+        logger.error(f"Failed to parse Pineapple transfer response: {str(e)}")
         raise TransferResponseError(str(e))
 
+    if store_error is not None:
+        # The lead is already with Pineapple: insert the complete record once more
+        # so the uuid/redirect and the duplicate guard are not lost
+        try:
+            await asyncio.to_thread(store_transfer_request, transfer, transfer_response)
+            logger.warning(f"[REQUEST-{request_id}] Transfer stored on retry after: {str(store_error)}")
+        except Exception as e:
+            # Lead sent to Pineapple but not recorded locally: needs manual follow-up
+            logger.critical(
+                "TRANSFER_NOT_RECORDED request=%s uuid=%s redirect_url=%s error=%s",
+                request_id, transfer_response.uuid, transfer_response.redirect_url, e,
+            )
+            raise TransferStorageError(
+                str(e),
+                details={
+                    "uuid": transfer_response.uuid,
+                    "redirect_url": transfer_response.redirect_url,
+                },
+            )
+    elif doc_id:
+        # Store the transfer response
+        try:
+            await asyncio.to_thread(update_transfer_response, doc_id, transfer_response)
+        except Exception as e:
+            if not settings.IS_PRODUCTION:
+                logger.error(f"❌ [DEV] [REQUEST-{request_id}] Failed to store Pineapple response: {str(e)}")
+            logger.error(f"Failed to store Pineapple transfer response: {str(e)}")
+            raise TransferResponseError(str(e))
+
+    if not settings.IS_PRODUCTION:
+        logger.info(f"💾 [DEV] [REQUEST-{request_id}] Transfer response stored in database")
+
     # Prepare email notification as background task
     logger.info(f"📧 [REQUEST-{request_id}] Queuing email notification...")
     
@@ -156,14 +198,13 @@ async def create_transfer(
         
         logger.info(f"📧 [REQUEST-{request_id}] Agent CC: {agent_email if agent_email else 'None'}")
         
-        # Add BCC if configured
-        bcc_emails = settings.ADMIN_BCC_EMAILS if hasattr(settings, 'ADMIN_BCC_EMAILS') and settings.ADMIN_BCC_EMAILS else None
+        bcc_emails = settings.ADMIN_BCC_EMAILS_LIST or None
         
         logger.info(f"📧 [REQUEST-{request_id}] Email recipients - TO: {settings.ADMIN_EMAILS}, BCC: {bcc_emails}")
         
         background_tasks.add_task(
             email_service.send_transfer_email,
-            recipient=settings.ADMIN_EMAILS,  # Use settings directly instead of email_service.admin_emails
+            recipient=settings.ADMIN_EMAILS_LIST,  # Use settings directly instead of email_service.admin_emails
             transfer_data=transfer,
             success=True,
             error_message=None,
@@ -1,6 +1,7 @@
-from pydantic import BaseModel, EmailStr, NonNegativeInt
+from pydantic import BaseModel, NonNegativeInt
 from typing import Optional, Any, Dict
 from datetime import date, datetime
+from app.schemas.types import Email
 from app.utils.examples import get_quote_example, get_quote_response_example
 
 class Address(BaseModel):
@@ -17,7 +18,7 @@ class RegularDriver(BaseModel):
     currentlyInsured: bool
     yearsWithoutClaims: NonNegativeInt
     relationToPolicyHolder: str
-    emailAddress: Optional[EmailStr] = None
+    emailAddress: Optional[Email] = None
     mobileNumber: Optional[str] = None
     idNumber: Optional[str] = None
     prvInsLosses: Optional[NonNegativeInt] = None
@@ -55,7 +56,6 @@ class Vehicle(BaseModel):
     regularDriver: RegularDriver
 
     model_config = {
-        "validate_assignment": True,
         "arbitrary_types_allowed": True,
         "extra": "allow"
     }
@@ -63,12 +63,11 @@ class Vehicle(BaseModel):
 class QuoteRequest(BaseModel):
     source: str
     externalReferenceId: str
-    agentEmail: Optional[EmailStr] = None
+    agentEmail: Optional[Email] = None
     agentBranch: Optional[str] = None
     vehicles: list[Vehicle]
     model_config = {
         "extra": "allow",
-        "validate_assignment": True,
         "json_schema_extra": {
             "example": get_quote_example()
         }
@@ -79,8 +78,7 @@ class QuoteResponse(BaseModel):
     excess: float
     quoteId: Optional[str] = None
     model_config = {
-        "extra": "allow",
-        "validate_assignment": True,
+        "extra": "ignore",
         "json_schema_extra": {
             "example": get_quote_response_example()
         }
@@ -103,6 +101,5 @@ class QuoteRetrievalResponse(BaseModel):
     updated_at: Optional[str] = None
     
     model_config = {
-        "extra": "allow",
-        "validate_assignment": True,
+        "extra": "ignore",
     }
@@ -1,13 +1,14 @@
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
+from app.schemas.types import Email
 from app.utils.examples import get_transfer_example, get_transfer_response_example
 
 
 class CustomerInfo(BaseModel):
     first_name: str
     last_name: str
-    email:Optional[EmailStr] = None
+    email: Optional[Email] = None
     contact_number: str
     id_number: Optional[str] = None
     quote_id: Optional[str] = None
@@ -21,16 +22,14 @@ class ExTransferRequest(BaseModel):
     customer_info: CustomerInfo
     agent_info: AgentInfo
     model_config = {
-        "extra": "allow",
-        "validate_assignment": True,
+        "extra": "ignore",
     }
 
 class InTransferRequest(BaseModel):
     customer_info: CustomerInfo
     agent_info: AgentInfo
     model_config = {
-        "extra": "allow",
-        "validate_assignment": True,
+        "extra": "ignore",
         "json_schema_extra": {"example": get_transfer_example()},
     }
 
@@ -39,7 +38,6 @@ class TransferResponse(BaseModel):
     uuid: str
     redirect_url: str
     model_config = {
-        "extra": "allow",
-        "validate_assignment": True,
+        "extra": "ignore",
         "json_schema_extra": {"example": get_transfer_response_example()},
     }
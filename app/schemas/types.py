@@ -0,0 +1,21 @@
+import re
+from typing import Annotated
+
+from pydantic import AfterValidator, WithJsonSchema
+
+# Lightweight shape check compiled once at import; full RFC validation is left
+# to the receiving systems (Pineapple and the SMTP server).
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _validate_email(value: str) -> str:
+    if not _EMAIL_RE.match(value):
+        raise ValueError("value is not a valid email address")
+    return value
+
+
+Email = Annotated[
+    str,
+    AfterValidator(_validate_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
@@ -1,16 +1,22 @@
+import asyncio
+import atexit
+import re
 import smtplib
 import ssl
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
 from email.utils import formatdate, make_msgid, formataddr
 from email.header import Header
-from typing import Optional, List, Union
-from config.settings import settings
+from functools import lru_cache, partial
+from typing import Optional, List, Union, Tuple
+from config.settings import settings, TEMPLATES_DIR
 import logging
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from datetime import datetime, timezone, timedelta
-import os
 from pathlib import Path
 
 from app.schemas.transfer import InTransferRequest
@@ -18,6 +24,17 @@ from app.schemas.email import EmailAttachment
 
 logger = logging.getLogger("email_service")
 
+# Patterns for deriving the plain-text fallback from rendered HTML
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=128)
+def _split_recipients(recipients: str) -> Tuple[str, ...]:
+    """Split a comma-separated address string; cached since the admin lists never change"""
+    return tuple(email for part in recipients.split(",") if (email := part.strip()))
+
+
 # South African Standard Time (SAST) is UTC+2
 SAST = timezone(timedelta(hours=2))
 
@@ -27,14 +44,57 @@ def get_sast_now() -> datetime:
 
 # Setup Jinja2 environment for templates
 template_env = Environment(
-    loader=FileSystemLoader(
-        os.path.join(
-            os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "templates"
-        )
-    ),
+    loader=FileSystemLoader(str(TEMPLATES_DIR)),
     autoescape=select_autoescape(["html", "xml"]),
+    # Templates ship with the deployment; skip per-render mtime checks and keep
+    # every compiled template in memory
+    auto_reload=False,
+    cache_size=-1,
+)
+
+# Body used when a notification template fails to render; parsed once at import
+_FALLBACK_TMPL = template_env.from_string(
+    """\
+<html>
+<body>
+    <h2>Email Notification</h2>
+    <p>An error occurred while rendering the email template '{{ name }}'.</p>
+    <p>Error details: {{ err }}</p>
+    <p>Please contact support if this issue persists.</p>
+    <hr>
+    <p><small>Context available: {{ keys | join(', ') }}</small></p>
+</body>
+</html>
+"""
 )
 
+# SMTP sends run on one small process-wide pool, shared by every EmailService.
+# Each worker thread keeps its own authenticated connection, so no SMTP
+# transaction is ever shared between threads.
+_smtp_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="smtp")
+_smtp_local = threading.local()
+_smtp_open: set = set()  # every live connection, closed at exit
+_smtp_open_lock = threading.Lock()
+
+
+def _quit_smtp(server: smtplib.SMTP_SSL) -> None:
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+def _close_all_smtp() -> None:
+    """QUIT every worker's connection (registered with atexit)"""
+    with _smtp_open_lock:
+        servers = list(_smtp_open)
+        _smtp_open.clear()
+    for server in servers:
+        _quit_smtp(server)
+
+
+atexit.register(_close_all_smtp)
+
 
 class EmailService:
     def __init__(self):
@@ -56,11 +116,50 @@ class EmailService:
             else ""
         )
         self.context = ssl.create_default_context()
-        self.admin_emails = settings.ADMIN_EMAILS
+        self.admin_emails = settings.ADMIN_EMAILS_LIST
         self.logger.info(
             f"SMTP config: server={self.smtp_server}, port={self.smtp_port}, username={self.smtp_username}, from={self.email_from}"
         )
 
+    def _get_smtp(self) -> smtplib.SMTP_SSL:
+        """
+        Return this thread's cached SMTP connection if it still answers NOOP,
+        otherwise open a new one and log in.
+        """
+        server = getattr(_smtp_local, "server", None)
+        if server is not None:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+
+        self.logger.info(
+            f"📧 Connecting to SMTP server {self.smtp_server}:{self.smtp_port} as {self.smtp_username}"
+        )
+        server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, context=self.context)
+        try:
+            server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        self.logger.info("✅ SMTP login successful")
+        _smtp_local.server = server
+        with _smtp_open_lock:
+            _smtp_open.add(server)
+        return server
+
+    def _close_smtp(self) -> None:
+        """QUIT and drop this thread's cached SMTP connection, if any"""
+        server = getattr(_smtp_local, "server", None)
+        _smtp_local.server = None
+        if server is None:
+            return
+        with _smtp_open_lock:
+            _smtp_open.discard(server)
+        _quit_smtp(server)
+
     def render_template(self, template_name: str, context: dict) -> str:
         """
         Render a template with the given context, ensuring 'now' is always available in SAST
@@ -71,6 +170,7 @@ class EmailService:
             template_context["now"] = get_sast_now()
 
         try:
+            # Jinja's own cache (cache_size=-1, auto_reload=False) keeps this a lookup
             template = self.template_env.get_template(template_name)
             return template.render(
                 **template_context
@@ -79,20 +179,13 @@ class EmailService:
             self.logger.error(f"Template rendering error for '{template_name}': {str(e)}")
             self.logger.error(f"Template context keys: {list(template_context.keys())}")
             # Return a basic fallback message if template rendering fails
-            return f"""
-            <html>
-            <body>
-                <h2>Email Notification</h2>
-                <p>An error occurred while rendering the email template '{template_name}'.</p>
-                <p>Error details: {str(e)}</p>
-                <p>Please contact support if this issue persists.</p>
-                <hr>
-                <p><small>Context available: {', '.join(template_context.keys())}</small></p>
-            </body>
-            </html>
-            """
-
-    def _parse_recipients(self, recipients: Union[List[str], str]) -> List[str]:
+            return _FALLBACK_TMPL.render(
+                name=template_name, err=str(e), keys=list(template_context.keys())
+            )
+
+    def _parse_recipients(
+        self, recipients: Union[List[str], tuple, str, None]
+    ) -> List[str]:
         """
         Parse recipients into a list of email addresses, handling both
         comma-separated strings and lists.
@@ -100,82 +193,70 @@ class EmailService:
         if not recipients:
             return []
 
-        # If already a list, clean each item
-        if isinstance(recipients, list):
-            return [email.strip() for email in recipients if email and email.strip()]
-
         # If a string, could be a single email or comma-separated list
         if isinstance(recipients, str):
-            # Handle comma-separated emails
-            if "," in recipients:
-                return [
-                    email.strip() for email in recipients.split(",") if email.strip()
-                ]
-            else:
-                return [recipients.strip()] if recipients.strip() else []
+            return list(_split_recipients(recipients))
+
+        # If already a list, clean each item
+        if isinstance(recipients, (list, tuple)):
+            return [email for item in recipients if item and (email := item.strip())]
 
         # Fallback for unexpected types
         self.logger.warning(f"Unexpected recipient format: {type(recipients)}")
         return []
 
-    def _get_recipients_header(self, emails: Union[List[str], str]) -> str:
-        """
-        Format email addresses for the email header fields (To, CC, BCC).
-        Returns a comma-separated string of email addresses.
-        """
-        email_list = self._parse_recipients(emails)
-        return ", ".join(email_list)
-
     def _strip_html_tags(self, html: str) -> str:
         """Convert HTML to plain text by removing all HTML tags"""
-        import re
-
-        return (
-            re.sub("<[^<]+?>", "", html).replace("\n", " ").replace("  ", " ").strip()
-        )
+        return _WS_RE.sub(" ", _TAG_RE.sub("", html)).strip()
 
     def _prepare_message(
         self,
         subject: str,
-        recipients: Union[List[str], str],
+        to_list: List[str],
         html_body: str,
-        cc: Optional[Union[List[str], str]] = None,
-        bcc: Optional[Union[List[str], str]] = None,
+        cc_list: Optional[List[str]] = None,
+        bcc_list: Optional[List[str]] = None,
         attachments: Optional[List[EmailAttachment]] = None,
+        include_plaintext: bool = False,
     ) -> MIMEMultipart:
-        """Prepare a well-formed MIME message with proper structure for email clients"""
+        """
+        Prepare a well-formed MIME message with proper structure for email clients.
+        Recipient lists must already be parsed with _parse_recipients.
+        Set include_plaintext to add a text/plain alternative derived from the HTML.
+        """
         # Create the root message - a multipart/mixed container
         msg_root = MIMEMultipart("mixed")
 
         # Set message headers with proper encoding
         msg_root["Subject"] = subject  # MIMEMultipart handles encoding automatically
         msg_root["From"] = str(self.email_from) if self.email_from is not None else ""
-        msg_root["To"] = self._get_recipients_header(recipients)
+        msg_root["To"] = ", ".join(to_list)
         msg_root["Date"] = formatdate(localtime=True)
         msg_root["Message-ID"] = make_msgid(domain="surestrat.co.za")
         msg_root["MIME-Version"] = "1.0"
 
-        if cc:
-            msg_root["Cc"] = self._get_recipients_header(cc)
-        if bcc:
-            msg_root["Bcc"] = self._get_recipients_header(bcc)
-
-        # Create a multipart/alternative part for the email body
-        msg_alternative = MIMEMultipart("alternative")
+        if cc_list:
+            msg_root["Cc"] = ", ".join(cc_list)
+        if bcc_list:
+            msg_root["Bcc"] = ", ".join(bcc_list)
 
-        # Generate plain text version from HTML
-        plain_body = self._strip_html_tags(html_body)
+        part_html = MIMEText(html_body, "html", "utf-8")
 
-        # First attach the plain text version (as fallback)
-        part_plain = MIMEText(plain_body, "plain", "utf-8")
-        msg_alternative.attach(part_plain)
+        if include_plaintext:
+            # Create a multipart/alternative part for the email body
+            msg_alternative = MIMEMultipart("alternative")
 
-        # Then attach the HTML version (preferred)
-        part_html = MIMEText(html_body, "html", "utf-8")
-        msg_alternative.attach(part_html)
+            # First attach the plain text version generated from the HTML (as fallback)
+            plain_body = self._strip_html_tags(html_body)
+            msg_alternative.attach(MIMEText(plain_body, "plain", "utf-8"))
 
-        # Attach the alternative part to the root message
-        msg_root.attach(msg_alternative)
+            # Then attach the HTML version (preferred)
+            msg_alternative.attach(part_html)
+            msg_root.attach(msg_alternative)
+        else:
+            # Admin notifications are read in HTML-capable clients; skip the
+            # stripped-text copy and attach the HTML body directly
+            msg_root.attach(part_html)
 
         # Handle attachments if provided
         if attachments:
@@ -212,8 +293,12 @@ class EmailService:
         cc: Optional[Union[List[str], str]] = None,
         bcc: Optional[Union[List[str], str]] = None,
         attachments: Optional[List[EmailAttachment]] = None,
+        include_plaintext: bool = False,
     ) -> bool:
-        """Send an HTML email with plain text fallback using a Jinja2 template"""
+        """
+        Send an HTML email using a Jinja2 template, optionally with a plain
+        text fallback part
+        """
         try:
             self.logger.info(f"📧 Starting email send: subject='{subject}', template='{template_name}'")
             
@@ -222,8 +307,8 @@ class EmailService:
 
             # Parse all recipient addresses into clean lists
             to_list = self._parse_recipients(recipients)
-            cc_list = self._parse_recipients(cc) if cc else []
-            bcc_list = self._parse_recipients(bcc) if bcc else []
+            cc_list = self._parse_recipients(cc)
+            bcc_list = self._parse_recipients(bcc)
 
             # Combine all recipient lists for the actual sending
             all_recipients = to_list + cc_list + bcc_list
@@ -236,76 +321,80 @@ class EmailService:
 
             # Prepare the complete MIME message
             msg = self._prepare_message(
-                subject, to_list, html_body, cc, bcc, attachments
+                subject,
+                to_list,
+                html_body,
+                cc_list,
+                bcc_list,
+                attachments,
+                include_plaintext=include_plaintext,
             )
 
             if not self.smtp_server:
                 self.logger.error("❌ SMTP server configuration is missing")
                 return False
 
-            self.logger.info(
-                f"📧 Connecting to SMTP server {self.smtp_server}:{self.smtp_port} as {self.smtp_username}"
-            )
-            # Connect to SMTP server and send the message
-            with smtplib.SMTP_SSL(
-                self.smtp_server, self.smtp_port, context=self.context
-            ) as server:
-                try:
-                    if (
-                        self.smtp_username is not None
-                        and self.smtp_password is not None
-                    ):
-                        self.logger.info(
-                            f"📧 Attempting SMTP login for user: {self.smtp_username}"
-                        )
-                        server.login(self.smtp_username, self.smtp_password)
-                        self.logger.info("✅ SMTP login successful")
-                    else:
-                        self.logger.error("❌ SMTP username or password is missing")
-                        return False
-                except smtplib.SMTPAuthenticationError as e:
-                    self.logger.error(f"❌ SMTP authentication failed: {str(e)}")
-                    return False
-                except smtplib.SMTPConnectError as e:
-                    self.logger.error(f"❌ SMTP connection failed: {str(e)}")
-                    return False
-                except Exception as e:
-                    self.logger.error(f"❌ SMTP login failed: {str(e)}")
-                    return False
+            if self.smtp_username is None or self.smtp_password is None:
+                self.logger.error("❌ SMTP username or password is missing")
+                return False
 
-                try:
-                    # Use sendmail instead of send_message for better control
-                    self.logger.info(f"📧 Sending message to {len(all_recipients)} recipients")
-                    rejected = server.sendmail(
-                        from_addr=self.smtp_username,
-                        to_addrs=all_recipients,
-                        msg=msg.as_string(),
-                    )
-                    
-                    if rejected:
-                        self.logger.warning(f"⚠️ Some recipients were rejected: {rejected}")
-                    else:
-                        self.logger.info("✅ Message sent to all recipients")
-                        
-                except smtplib.SMTPRecipientsRefused as e:
-                    self.logger.error(f"❌ All recipients refused: {str(e)}")
-                    return False
-                except smtplib.SMTPDataError as e:
-                    self.logger.error(f"❌ SMTP data error: {str(e)}")
-                    return False
-                except Exception as e:
-                    self.logger.error(f"❌ Failed to send message via SMTP: {str(e)}")
-                    return False
+            try:
+                server = self._get_smtp()
+            except smtplib.SMTPAuthenticationError as e:
+                self.logger.error(f"❌ SMTP authentication failed: {str(e)}")
+                return False
+            except smtplib.SMTPConnectError as e:
+                self.logger.error(f"❌ SMTP connection failed: {str(e)}")
+                return False
+            except Exception as e:
+                self.logger.error(f"❌ SMTP login failed: {str(e)}")
+                return False
+
+            try:
+                # send_message flattens the MIME tree straight to bytes (no
+                # intermediate str copy) and strips the Bcc header on the wire
+                self.logger.info(f"📧 Sending message to {len(all_recipients)} recipients")
+                rejected = server.send_message(
+                    msg,
+                    from_addr=self.smtp_username,
+                    to_addrs=all_recipients,
+                )
+
+                if rejected:
+                    self.logger.warning(f"⚠️ Some recipients were rejected: {rejected}")
+                else:
+                    self.logger.info("✅ Message sent to all recipients")
+
+            except smtplib.SMTPRecipientsRefused as e:
+                self.logger.error(f"❌ All recipients refused: {str(e)}")
+                return False
+            except smtplib.SMTPDataError as e:
+                self.logger.error(f"❌ SMTP data error: {str(e)}")
+                return False
+            except Exception as e:
+                # The connection state is unknown; reconnect on the next send
+                self._close_smtp()
+                self.logger.error(f"❌ Failed to send message via SMTP: {str(e)}")
+                return False
 
             self.logger.info(f"✅ Email sent successfully to {', '.join(to_list)}")
             return True
 
         except Exception as e:
             self.logger.error(f"❌ Failed to send email (general error): {str(e)}")
-            import traceback
             self.logger.error(f"❌ Traceback: {traceback.format_exc()}")
             return False
 
+    async def send_email_async(self, *args, **kwargs) -> bool:
+        """
+        Run send_email on the SMTP worker pool so smtplib never blocks the
+        event loop. Accepts the same arguments as send_email.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _smtp_pool, partial(self.send_email, *args, **kwargs)
+        )
+
     async def send_transfer_email(
         self,
         recipient: Union[List[str], str],
@@ -336,7 +425,7 @@ class EmailService:
             }
             
             self.logger.info(f"📧 Sending transfer email to: {recipient}")
-            result = self.send_email(
+            result = await self.send_email_async(
                 subject=subject,
                 recipients=recipient,
                 template_name="transfer_notification.html",
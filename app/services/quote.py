@@ -1,38 +1,62 @@
 import httpx
+import logging
 import datetime
-import json
+import orjson
 
-from uuid import uuid4
+import secrets
 
 from config.settings import settings
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
-from app.utils.supabase import supabase_client
+from pydantic import TypeAdapter
 
-from app.schemas.quote import QuoteRequest, QuoteResponse
+from app.utils.supabase import get_supabase_client
+from app.utils.http_client import get_http_client, PINEAPPLE_HEADERS
+
+from app.schemas.quote import QuoteRequest, QuoteResponse, Vehicle
 
 from app.utils.rich_logger import get_rich_logger
 
 logger = get_rich_logger("Surestrat -> Pineapple -> API {supabase}")
-db = supabase_client
+
+# Serializes the whole vehicles list in one pydantic-core call
+_VEHICLES_ADAPTER = TypeAdapter(List[Vehicle])
 
 
 def safe_uuid():
-    # Generate a valid short UUID (8 chars, no leading underscore)
-    return str(uuid4()).replace("-", "")[:8]
+    # Generate a valid short id (8 hex chars, no leading underscore)
+    return secrets.token_hex(4)
 
 
-def clean_dict(d):
-    """Recursively remove keys with None values from dicts and lists."""
+def _has_none_value(obj) -> bool:
+    """True if any dict nested in obj has a None value."""
+    if isinstance(obj, dict):
+        return any(v is None or _has_none_value(v) for v in obj.values())
+    elif isinstance(obj, list):
+        return any(_has_none_value(i) for i in obj)
+    return False
+
+
+def _drop_none(d):
     if isinstance(d, dict):
-        return {k: clean_dict(v) for k, v in d.items() if v is not None}
+        return {k: _drop_none(v) for k, v in d.items() if v is not None}
     elif isinstance(d, list):
-        return [clean_dict(i) for i in d]
+        return [_drop_none(i) for i in d]
     else:
         return d
 
 
+def clean_dict(d):
+    """Recursively remove keys with None values from dicts and lists.
+
+    Payloads without any None values are returned unchanged instead of copied.
+    """
+    if not _has_none_value(d):
+        return d
+    return _drop_none(d)
+
+
 def store_quote_request(
     quote_data: QuoteRequest
 ):
@@ -44,17 +68,14 @@ def store_quote_request(
             "internal_reference": quote_data.externalReferenceId,
             "status": "PENDING",
             # Store vehicles as JSON array (Supabase will handle JSONB conversion)
-            "vehicles": [vehicle.model_dump(mode="json") for vehicle in quote_data.vehicles],
+            "vehicles": _VEHICLES_ADAPTER.dump_python(quote_data.vehicles, mode="json"),
             # Include agent information if provided
             "agent_email": quote_data.agentEmail,
             "agent_branch": quote_data.agentBranch,
         }
-        # Clean None values from payload
+        # Clean None values from payload (a dict in always yields a dict out)
         flattened_data = clean_dict(quote_record)
-        # Ensure we're passing a dict to create_document
-        if not isinstance(flattened_data, dict):
-            raise ValueError("Expected a dictionary after cleaning data")
-        document = db.create_document(
+        document = get_supabase_client().create_document(
             table=settings.QUOTES_TABLE,
             data=flattened_data,
         )
@@ -82,7 +103,7 @@ def update_quote_response(
         # if response_data.quoteId:
         #     update_data["quote_id"] = response_data.quoteId
             
-        doc = db.update_document(
+        doc = get_supabase_client().update_document(
             table=settings.QUOTES_TABLE,
             document_id=document_id,
             data=update_data
@@ -107,7 +128,7 @@ def get_quote_by_id(quote_id: int) -> Optional[Dict[str, Any]]:
             return None
 
         # Get the document directly by ID
-        document = db.get_document(
+        document = get_supabase_client().get_document(
             table=settings.QUOTES_TABLE,
             document_id=quote_id
         )
@@ -129,8 +150,6 @@ async def send_quote_request(
     request_id: Optional[str] = None,
 ):
     try:
-        import json  # Ensure json is imported if not already at module level
-
         update_data = quote_data.model_dump(mode="json")
 
         # Ensure 'source' is 'SureStrat' (case-sensitive)
@@ -147,22 +166,13 @@ async def send_quote_request(
             f"[send_quote_request] Using API endpoint: {settings.PINEAPPLE_QUOTE_API_URL}"
         )
 
-        logger.debug(f"[send_quote_request] Outgoing payload (dict): {update_data}")
-        logger.debug(
-            f"[send_quote_request] Outgoing payload (JSON): {json.dumps(update_data)}"
-        )
+        logger.debug("[send_quote_request] Outgoing payload (dict): %s", update_data)
 
-        # Construct authorization token exactly as seen in Postman collection
-        auth_token = (
-            f"KEY={settings.PINEAPPLE_API_KEY} SECRET={settings.PINEAPPLE_API_SECRET}"
-        )
+        # Serialize once: the same bytes are logged and sent as the request body
+        body = orjson.dumps(update_data)
 
-        # Mask secrets in logs
-        masked_auth = f"KEY={settings.PINEAPPLE_API_KEY[:5]}...{settings.PINEAPPLE_API_KEY[-3:]} SECRET=***"
-        logger.info(
-            f"[send_quote_request] Using authorization token: Bearer {masked_auth}"
-        )
-        logger.info(f"[send_quote_request] Outgoing body: {json.dumps(update_data)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[send_quote_request] Outgoing body: %s", body.decode())
 
         api_url = settings.PINEAPPLE_QUOTE_API_URL
         if not api_url:
@@ -175,26 +185,24 @@ async def send_quote_request(
 
         # Inner try-except for the HTTP request itself
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info(f"[send_quote_request] Making POST request to {api_url}")
-                response = await client.post(
-                    url=api_url,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Authorization": f"Bearer {auth_token}",
-                    },
-                    json=update_data,  # httpx handles JSON serialization for the json parameter
-                )
-                logger.info(
-                    f"[send_quote_request] Pineapple response status: {response.status_code}"
-                )
-                logger.info(
-                    f"[send_quote_request] Pineapple response headers: {str(response.headers)}"
-                )  # Log headers as string
-                logger.info(
-                    f"[send_quote_request] Pineapple response body: {response.text}"
-                )
-                return response
+            client = get_http_client()
+            logger.info(f"[send_quote_request] Making POST request to {api_url}")
+            response = await client.post(
+                url=api_url,
+                headers=PINEAPPLE_HEADERS,
+                content=body,  # pre-serialized JSON; Content-Type is in PINEAPPLE_HEADERS
+            )
+            logger.info(
+                f"[send_quote_request] Pineapple response status: {response.status_code}"
+            )
+            logger.info(
+                f"[send_quote_request] Pineapple response headers: {str(response.headers)}"
+            )  # Log headers as string
+            # Log the raw body bytes lazily; the endpoint parses them once
+            logger.debug(
+                "[send_quote_request] Pineapple response body: %r", response.content
+            )
+            return response
         except httpx.RequestError as exc:  # Catch network errors, timeouts, etc.
             logger.error(
                 f"[send_quote_request] HTTP request failed: {exc!r} - URL: {exc.request.url!r}"
@@ -1,9 +1,15 @@
+import asyncio
+import logging
+import secrets
+import threading
 import httpx
+import orjson
 from typing import Optional, Dict, Any
 
-from uuid import uuid4
+from cachetools import TTLCache
 
-from app.utils.supabase import supabase_client
+from app.utils.supabase import get_supabase_client, normalize_identifier
+from app.utils.http_client import get_http_client, PINEAPPLE_HEADERS
 
 from config.settings import settings
 
@@ -14,110 +20,119 @@ from app.schemas.transfer import (
 )
 
 from app.utils.rich_logger import get_rich_logger
-from datetime import datetime
-from zoneinfo import ZoneInfo
 
 logger = get_rich_logger("Surestrat -> Pineapple -> API {supabase}")
-db = supabase_client
 
+# Recently seen transfers keyed by ("id" | "contact", normalized value). Only
+# positive hits are cached, so a miss always reaches the database; entries are
+# refreshed when a transfer is stored. Guarded by a lock because stores run in
+# worker threads.
+_DUPLICATE_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_DUPLICATE_CACHE_LOCK = threading.Lock()
 
-def safe_uuid():
-    return str(uuid4()).replace("-", "")[:8]
-
-
-async def check_existing_transfer_by_id_number(
-    id_number: str, request_id: Optional[str] = None
-) -> Optional[Dict[str, Any]]:
-    """
-    Check if a transfer already exists for the given ID number.
-
-    Args:
-        id_number: The ID number to check for existing transfers
-        request_id: Optional ID for logging/tracking
-
-    Returns:
-        Optional[Dict[str, Any]]: The existing transfer document if found, None otherwise
-    """
-    try:
-        if not id_number:
-            logger.warning(f"[{request_id}] Empty ID number provided for transfer check")
-            return None
-
-        # Clean the ID number (remove spaces, dashes, etc.)
-        normalized_id = id_number.replace(" ", "").replace("-", "").strip()
-
-        if not settings.IS_PRODUCTION:
-            logger.info(f"🔍 [DEV] [{request_id}] Checking for existing transfer with normalized ID: {normalized_id}")
 
-        logger.info(f"[{request_id}] Checking for existing transfer with ID number: {normalized_id}")
+def _duplicate_key(field: str, value: Optional[str]):
+    # Same canonical form as the normalized_* columns the database matches on
+    normalized = normalize_identifier(value)
+    return (field, normalized) if normalized else None
 
-        # Use Supabase to search for existing transfers
-        existing_transfer = db.check_duplicate_transfer(id_number, "")
 
-        if existing_transfer:
-            if not settings.IS_PRODUCTION:
-                logger.info(f"✅ [DEV] [{request_id}] Found existing transfer by ID - Transfer ID: {existing_transfer.get('id')}")
+def _remember_transfer(document: Dict[str, Any], **keys: Optional[str]) -> None:
+    """Cache the fields of a transfer the duplicate error needs, under each given key"""
+    entry = {
+        "id": document.get("id"),
+        "created_at": document.get("created_at", ""),
+        "id_number": document.get("id_number", ""),
+    }
+    with _DUPLICATE_CACHE_LOCK:
+        for field, value in keys.items():
+            key = _duplicate_key(field, value)
+            if key:
+                _DUPLICATE_CACHE[key] = entry
 
-            logger.info(f"[{request_id}] Found existing transfer with ID {normalized_id}: {existing_transfer.get('id')}")
-            return existing_transfer
 
-        if not settings.IS_PRODUCTION:
-            logger.info(f"✅ [DEV] [{request_id}] No duplicate found by ID number")
-
-        logger.info(f"[{request_id}] No existing transfer found for ID number: {normalized_id}")
+def _cached_transfer(
+    id_number: Optional[str], contact_number: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Answer the duplicate check from the cache only when it gives the same result
+    as check_duplicate_transfer, which prefers an ID number match.
+    """
+    id_key = _duplicate_key("id", id_number)
+    contact_key = _duplicate_key("contact", contact_number)
+    with _DUPLICATE_CACHE_LOCK:
+        entry = _DUPLICATE_CACHE.get(id_key) if id_key else None
+        if entry:
+            return {**entry, "matched_field": "ID number"}
+        entry = _DUPLICATE_CACHE.get(contact_key) if contact_key else None
+    if not entry:
         return None
+    if id_key is None:
+        return {**entry, "matched_field": "contact number"}
+    if normalize_identifier(entry["id_number"]) == id_key[1]:
+        return {**entry, "matched_field": "ID number"}
+    # An uncached row could still match the ID number; let the database decide
+    return None
 
-    except Exception as e:
-        logger.error(f"[{request_id}] Error checking for existing transfer: {str(e)}")
-        return None
+
+def safe_uuid():
+    # 8 hex chars, same format as the quote service
+    return secrets.token_hex(4)
 
 
-async def check_existing_transfer_by_contact_number(
-    contact_number: str, request_id: Optional[str] = None
+async def check_existing_transfer_combined(
+    id_number: Optional[str] = None,
+    contact_number: Optional[str] = None,
+    request_id: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
     """
-    Check if a transfer already exists for the given contact number.
+    Check the database for a transfer matching the ID number or the contact
+    number in a single query.
 
     Args:
-        contact_number: The contact number to check for existing transfers
+        id_number: The ID number to check (optional)
+        contact_number: The contact number to check (optional)
         request_id: Optional ID for logging/tracking
 
     Returns:
-        Optional[Dict[str, Any]]: The existing transfer document if found, None otherwise
+        Optional[Dict[str, Any]]: The existing transfer document with "matched_field"
+        set, or None if no transfer matches
     """
+    if not id_number and not contact_number:
+        return None
+
+    cached = _cached_transfer(id_number, contact_number)
+    if cached:
+        logger.info(f"[{request_id}] Existing transfer {cached['id']} served from duplicate cache")
+        return cached
+
     try:
-        if not contact_number:
-            logger.warning(f"[{request_id}] Empty contact number provided for transfer check")
+        existing_transfer = await asyncio.to_thread(
+            get_supabase_client().check_duplicate_transfer, id_number or "", contact_number or ""
+        )
+        if not existing_transfer:
+            logger.info(f"[{request_id}] No existing transfer found by ID or contact number")
             return None
 
-        # Clean the contact number (remove spaces, dashes, plus signs, etc.)
-        normalized_contact = (
-            contact_number.replace(" ", "").replace("-", "").replace("+", "").strip()
+        # check_duplicate_transfer prefers ID number matches; work out which one hit
+        normalized_id = normalize_identifier(id_number)
+        existing_transfer["matched_field"] = (
+            "ID number"
+            if normalized_id and existing_transfer.get("normalized_id_number") == normalized_id
+            else "contact number"
         )
-
-        if not settings.IS_PRODUCTION:
-            logger.info(f"🔍 [DEV] [{request_id}] Checking for existing transfer with normalized contact: {normalized_contact}")
-
-        logger.info(f"[{request_id}] Checking for existing transfer with contact number: {normalized_contact}")
-
-        # Use Supabase to search for existing transfers
-        existing_transfer = db.check_duplicate_transfer("", contact_number)
-
-        if existing_transfer:
-            if not settings.IS_PRODUCTION:
-                logger.info(f"✅ [DEV] [{request_id}] Found existing transfer by contact - Transfer ID: {existing_transfer.get('id')}")
-
-            logger.info(f"[{request_id}] Found existing transfer with contact {normalized_contact}: {existing_transfer.get('id')}")
-            return existing_transfer
-
-        if not settings.IS_PRODUCTION:
-            logger.info(f"✅ [DEV] [{request_id}] No duplicate found by contact number")
-
-        logger.info(f"[{request_id}] No existing transfer found for contact number: {normalized_contact}")
-        return None
+        if existing_transfer["matched_field"] == "ID number":
+            _remember_transfer(existing_transfer, id=id_number)
+        else:
+            _remember_transfer(existing_transfer, contact=contact_number)
+        logger.info(
+            f"[{request_id}] Found existing transfer {existing_transfer.get('id')} "
+            f"by {existing_transfer['matched_field']}"
+        )
+        return existing_transfer
 
     except Exception as e:
-        logger.error(f"[{request_id}] Error checking for existing transfer by contact: {str(e)}")
+        logger.error(f"[{request_id}] Error checking for existing transfer: {str(e)}")
         return None
 
 
@@ -201,21 +216,11 @@ async def check_existing_transfer(
     if not settings.IS_PRODUCTION:
         logger.info(f"🔍 [DEV] [{request_id}] Starting duplicate check - database first")
     
-    # Check by ID number first (more specific)
-    if id_number:
-        existing_by_id = await check_existing_transfer_by_id_number(id_number, request_id)
-        if existing_by_id:
-            existing_by_id["source"] = "database"
-            existing_by_id["matched_field"] = "ID number"
-            return existing_by_id
-
-    # Check by contact number if ID number didn't find anything
-    if contact_number:
-        existing_by_contact = await check_existing_transfer_by_contact_number(contact_number, request_id)
-        if existing_by_contact:
-            existing_by_contact["source"] = "database"
-            existing_by_contact["matched_field"] = "contact number"
-            return existing_by_contact
+    # ID number and contact number are checked in one round-trip (ID matches win)
+    existing = await check_existing_transfer_combined(id_number, contact_number, request_id)
+    if existing:
+        existing["source"] = "database"
+        return existing
     
     # If no duplicates found in database, check Pineapple system
     if not settings.IS_PRODUCTION:
@@ -249,7 +254,12 @@ async def check_existing_transfer(
 
 def store_transfer_request(
     transfer_data: InTransferRequest,
+    response_data: Optional[TransferResponse] = None,
 ):
+    """
+    Insert the lead row. When Pineapple's response is already known (the retry
+    after a failed concurrent insert), its uuid/redirect_url go in the same row.
+    """
     try:
         transfer_record = {
             "first_name": transfer_data.customer_info.first_name,
@@ -262,11 +272,26 @@ def store_transfer_request(
             "agent_name": transfer_data.agent_info.agent_email,  # Map email to name for backward compatibility
             "branch_name": transfer_data.agent_info.branch_name,
         }
+        # Canonical forms are computed once here so duplicate checks can use
+        # plain indexed equality instead of normalizing on every lookup
+        transfer_record["normalized_id_number"] = normalize_identifier(transfer_record["id_number"])
+        transfer_record["normalized_contact_number"] = normalize_identifier(
+            transfer_record["contact_number"]
+        )
+        if response_data is not None:
+            transfer_record["uuid"] = response_data.uuid
+            transfer_record["redirect_url"] = response_data.redirect_url
 
-        doc = db.create_document(
+        doc = get_supabase_client().create_document(
             table=settings.TRANSFERS_TABLE,
             data=transfer_record
         )
+        if doc:
+            _remember_transfer(
+                doc,
+                id=transfer_record["id_number"],
+                contact=transfer_record["contact_number"],
+            )
         return doc
 
     except Exception as e:
@@ -283,7 +308,7 @@ def update_transfer_response(
             "redirect_url": response_data.redirect_url,
         }
 
-        doc = db.update_document(
+        doc = get_supabase_client().update_document(
             table=settings.TRANSFERS_TABLE,
             document_id=document_id,
             data=update_data
@@ -315,55 +340,50 @@ async def send_transfer_request(
             "contact_number": transfer_data.customer_info.contact_number,
         }
 
-        # Log environment information for debugging
-        environment = "PRODUCTION" if settings.IS_PRODUCTION else "TEST"
-        logger.info(f"[send_transfer_request] Operating in {environment} environment")
-        logger.info(
-            f"[send_transfer_request] Using API endpoint: {settings.PINEAPPLE_TRANSFER_API_URL}"
+        # Verbose request details are DEBUG-only and formatted lazily
+        logger.debug(
+            "[send_transfer_request] Operating in %s environment",
+            "PRODUCTION" if settings.IS_PRODUCTION else "TEST",
         )
-
-        # Construct authorization token exactly as seen in Postman collection
-        auth_token = (
-            f"KEY={settings.PINEAPPLE_API_KEY} SECRET={settings.PINEAPPLE_API_SECRET}"
+        logger.debug(
+            "[send_transfer_request] Payload to external API: %s", request_payload
         )
 
-        # Mask secrets in logs
-        masked_auth = f"KEY={settings.PINEAPPLE_API_KEY[:5]}...{settings.PINEAPPLE_API_KEY[-3:]} SECRET=***"
+        client = get_http_client()
+        if settings.PINEAPPLE_TRANSFER_API_URL is None:
+            raise ValueError("PINEAPPLE_TRANSFER_API_URL is not configured")
+
+        response: httpx.Response = await client.post(
+            url=settings.PINEAPPLE_TRANSFER_API_URL,
+            headers=PINEAPPLE_HEADERS,
+            content=orjson.dumps(request_payload),
+        )
         logger.info(
-            f"[send_transfer_request] Using authorization token: Bearer {masked_auth}"
+            "[send_transfer_request] POST %s -> %s",
+            settings.PINEAPPLE_TRANSFER_API_URL,
+            response.status_code,
         )
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            logger.info(
-                f"[send_transfer_request] Payload to external API: {request_payload}"
-            )
-            if settings.PINEAPPLE_TRANSFER_API_URL is None:
-                raise ValueError("PINEAPPLE_TRANSFER_API_URL is not configured")
-
-            response: httpx.Response = await client.post(
-                url=settings.PINEAPPLE_TRANSFER_API_URL,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {auth_token}",
-                },
-                json=request_payload,
-            )
-            logger.info(
-                f"[send_transfer_request] Pineapple response status: {response.status_code}"
-            )
-            logger.info(
-                f"[send_transfer_request] Pineapple response headers: {str(response.headers)}"
-            )
-            logger.info(
-                f"[send_transfer_request] Pineapple response body: {response.text}"
+        logger.debug(
+            "[send_transfer_request] Pineapple response headers: %s", response.headers
+        )
+        # Read the body once; it is parsed from bytes and only a prefix is logged
+        body = response.content
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[send_transfer_request] Pineapple response body: %s",
+                body[:512].decode("utf-8", "replace"),
             )
 
-            try:
-                response_data = response.json()
-            except Exception as e:
-                logger.error(f"Failed to parse JSON from Pineapple response: {str(e)}")
-                return {"error": f"Invalid JSON response: {str(e)}"}
-            return response_data
+        try:
+            response_data = orjson.loads(body)
+        except Exception as e:
+            logger.error(
+                "Failed to parse JSON from Pineapple response (status %s): %s",
+                response.status_code,
+                e,
+            )
+            return {"error": f"Invalid JSON response: {str(e)}"}
+        return response_data
 
     except Exception as e:
         logger.error(f"Exception in send_transfer_request: {str(e)}")
@@ -1,7 +1,10 @@
+import asyncio
 import logging
 
 import datetime
 
+from functools import lru_cache
+
 from uuid import uuid4
 
 from appwrite.client import Client
@@ -18,11 +21,12 @@ from appwrite.query import Query
 
 logger = logging.getLogger("pineapple-surestrat-api")
 
-
 def safe_uuid():
-    return str(uuid4()).replace("-", "")
+    # Full 32-char hex: these are Appwrite document ids, so keep all 122 random bits
+    return uuid4().hex
 
 
+@lru_cache(maxsize=1)
 def get_appwrite_client():
     client = Client()
 
@@ -54,8 +58,9 @@ def get_appwrite_client():
     return client
 
 
+@lru_cache(maxsize=1)
 def get_database():
-    """Get the Appwrite database service instance"""
+    """Get the Appwrite database service instance (created once and reused)"""
     client = get_appwrite_client()
     return Databases(client)
 
@@ -70,6 +75,11 @@ async def get_server_timestamp():
 
 
 def _prepare_data_for_appwrite(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Storage-ready payloads (no dates, no None) are passed through untouched
+    if not any(
+        value is None or isinstance(value, datetime.date) for value in data.values()
+    ):
+        return data
     result = {}
     for key, value in data.items():
         if isinstance(value, datetime.datetime):
@@ -84,11 +94,20 @@ def _prepare_data_for_appwrite(data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 class AppwriteService:
+    """
+    Appwrite document helpers. The Appwrite SDK is synchronous, so every call
+    into it runs in a worker thread to keep the event loop free.
+    """
+
     def __init__(self, database_id: Optional[str] = None):
         self.database: Databases = get_database()
         self.database_id: str = database_id or settings.DATABASE_ID or ""
         self.transfer_collection_id: str | None = settings.TRANSFER_COL_ID
         self.quote_collection_id: str | None = settings.QUOTE_COL_ID
+        self._collection_map: Dict[str, Optional[str]] = {
+            "transfer": self.transfer_collection_id,
+            "quote": self.quote_collection_id,
+        }
 
         if not self.database_id:
             logger.error(
@@ -103,7 +122,7 @@ class AppwriteService:
         if self.quote_collection_id:
             logger.info(f"Quote collection_id: {self.quote_collection_id}")
 
-    def create_document(
+    async def create_document(
         self, data: dict, collection_type: str, document_id: Optional[str] = None
     ):
         try:
@@ -115,7 +134,8 @@ class AppwriteService:
             try:
                 prepared_data = _prepare_data_for_appwrite(data)
 
-                result = self.database.create_document(
+                result = await asyncio.to_thread(
+                    self.database.create_document,
                     database_id=self.database_id,
                     collection_id=collection_id,
                     document_id=document_id,
@@ -130,7 +150,7 @@ class AppwriteService:
             logger.error(f"Error in create_document: {str(e)}")
             return {"error": str(e)}
 
-    def update_document(
+    async def update_document(
         self,
         document_id: str,
         data: dict,
@@ -142,7 +162,8 @@ class AppwriteService:
             return {"error": f"Unknown collection type: {collection_type}"}
         try:
             prepared_data = _prepare_data_for_appwrite(data)
-            result = self.database.update_document(
+            result = await asyncio.to_thread(
+                self.database.update_document,
                 database_id=self.database_id,
                 collection_id=col_id,
                 document_id=document_id,
@@ -156,7 +177,7 @@ class AppwriteService:
         except Exception as e:
             return {"error": str(e)}
 
-    def search_documents(
+    async def search_documents(
         self,
         collection_type: str,
         search_query: str,
@@ -172,15 +193,28 @@ class AppwriteService:
                 "collection_id": col_id,
                 "queries": queries,
             }
-            result = self.database.list_documents(**params)
+            result = await asyncio.to_thread(self.database.list_documents, **params)
             return result
         except Exception as e:
             return e
 
-    def list_documents(self, collection_type: str, fields: Optional[list[str]] = None):
+    async def list_documents(
+        self,
+        collection_type: str,
+        fields: Optional[list[str]] = None,
+        equal_filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        order_desc: Optional[str] = None,
+    ):
         col_id = self._get_collection_id(collection_type)
         try:
             queries = []
+            if equal_filters:
+                queries.extend(Query.equal(key, value) for key, value in equal_filters.items())
+            if order_desc:
+                queries.append(Query.order_desc(order_desc))
+            if limit is not None:
+                queries.append(Query.limit(limit))
             if fields:
                 queries.append(Query.select(fields))
             params = {
@@ -188,13 +222,13 @@ class AppwriteService:
                 "collection_id": col_id,
             }
             if queries:
-                params["queries"] = str(queries)
-            result = self.database.list_documents(**params)
+                params["queries"] = queries
+            result = await asyncio.to_thread(self.database.list_documents, **params)
             return result
         except AppwriteException as ae:
-            return {f"error: {ae}"}
+            return {"error": str(ae)}
 
-    def get_document_by_id(
+    async def get_document_by_id(
         self,
         collection_type: str,
         document_id: str,
@@ -208,7 +242,8 @@ class AppwriteService:
             return {"error": f"Unknown collection type: {collection_type}"}
 
         try:
-            result = self.database.get_document(
+            result = await asyncio.to_thread(
+                self.database.get_document,
                 database_id=self.database_id,
                 collection_id=col_id,
                 document_id=document_id,
@@ -219,10 +254,4 @@ class AppwriteService:
             return {"error": str(ae)}
 
     def _get_collection_id(self, collection_type: str):
-
-        if collection_type == "transfer":
-            return self.transfer_collection_id
-        elif collection_type == "quote":
-            return self.quote_collection_id
-        else:
-            return None
+        return self._collection_map.get(collection_type)
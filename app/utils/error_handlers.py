@@ -1,96 +1,97 @@
 """
 Global exception handlers for FastAPI application
 """
-from datetime import datetime
-from typing import Union, Optional
+import time
+from typing import Dict, Union
 
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from app.utils.orjson_response import ORJSONResponse
+from app.utils.response import _now_iso, error_response
 from pydantic import ValidationError
 
 from app.utils.exceptions import APIError
 from app.utils.rich_logger import get_rich_logger
+from config.settings import settings
 
 logger = get_rich_logger("error_handlers")
+_log_error = logger.error
+_log_warning = logger.warning
+# Production still logs full tracebacks, but at most once per exception type per
+# _TRACEBACK_INTERVAL seconds; repeats in that window get the one-line summary,
+# so an error storm cannot tie the server up formatting identical tracebacks
+_TRACEBACK_INTERVAL = 60.0
+_last_traceback: Dict[type, float] = {}
 
 
-def create_error_response(
-    error_code: str,
-    message: str,
-    user_message: str,
-    details: Optional[dict] = None,
-    status_code: int = 500
-) -> JSONResponse:
-    """Create standardized error response"""
-    return JSONResponse(
-        status_code=status_code,
-        content={
-            "success": False,
-            "error": {
-                "code": error_code,
-                "message": user_message,
-                "technical_message": message,
-                "details": details or {}
-            },
-            "timestamp": datetime.now().isoformat()
+def _want_traceback(exc_type: type) -> bool:
+    if not settings.IS_PRODUCTION:
+        return True
+    now = time.monotonic()
+    last = _last_traceback.get(exc_type)
+    if last is not None and now - last < _TRACEBACK_INTERVAL:
+        return False
+    _last_traceback[exc_type] = now
+    return True
+
+_ARROW = " -> "
+
+
+def _format_errors(raw: list) -> list:
+    """Flatten pydantic error dicts into the validation_errors response shape"""
+    return [
+        {
+            "field": _ARROW.join(map(str, error["loc"])),
+            "message": error["msg"],
+            "input": error.get("input"),
+            "type": error.get("type")
         }
-    )
+        for error in raw
+    ]
 
 
-def create_success_response(data: Union[dict, list], status_code: int = 200) -> JSONResponse:
+# Both modules share one error response builder
+create_error_response = error_response
+
+
+def create_success_response(data: Union[dict, list], status_code: int = 200) -> ORJSONResponse:
     """Create standardized success response"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "success": True,
             "data": data,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     )
 
 
 async def api_error_handler(request, exc):
     """Handle custom API errors"""
-    # Handle case where detail might be a string or dict
-    if isinstance(exc.detail, dict):
-        message = exc.detail.get("message", str(exc.detail))
-        user_message = exc.detail.get("user_message", message)
-        details = exc.detail.get("details", {})
-        error_code = getattr(exc, 'error_code', 'API_ERROR')
-    else:
-        message = str(exc.detail)
-        user_message = message
-        details = {}
-        error_code = getattr(exc, 'error_code', 'API_ERROR')
+    error_code = exc.error_code
+    message = exc.message
     
-    logger.error(
-        f"API Error: {error_code} - {message} - Path: {request.url} - Method: {request.method}"
+    _log_error(
+        "API Error: %s - %s - Path: %s - Method: %s",
+        error_code, message, request.url.path, request.scope["method"],
     )
     
     return create_error_response(
         error_code=error_code,
         message=message,
-        user_message=user_message,
-        details=details,
+        user_message=exc.user_message,
+        details=exc.details,
         status_code=exc.status_code
     )
 
 
 async def validation_exception_handler(request, exc):
     """Handle Pydantic validation errors"""
-    errors = []
-    for error in exc.errors():
-        field_path = " -> ".join(str(loc) for loc in error["loc"])
-        errors.append({
-            "field": field_path,
-            "message": error["msg"],
-            "input": error.get("input"),
-            "type": error.get("type")
-        })
+    errors = _format_errors(exc.errors())
     
-    logger.warning(
-        f"Validation error - Path: {request.url} - Method: {request.method} - Errors: {len(errors)}"
+    _log_warning(
+        "Validation error - Path: %s - Method: %s - Errors: %d",
+        request.url.path, request.scope["method"], len(errors),
     )
     
     return create_error_response(
@@ -104,18 +105,11 @@ async def validation_exception_handler(request, exc):
 
 async def pydantic_validation_exception_handler(request, exc):
     """Handle Pydantic ValidationError (different from RequestValidationError)"""
-    errors = []
-    for error in exc.errors():
-        field_path = " -> ".join(str(loc) for loc in error["loc"])
-        errors.append({
-            "field": field_path,
-            "message": error["msg"],
-            "input": error.get("input"),
-            "type": error.get("type")
-        })
+    errors = _format_errors(exc.errors())
     
-    logger.warning(
-        f"Pydantic validation error - Path: {request.url} - Method: {request.method} - Errors: {len(errors)}"
+    _log_warning(
+        "Pydantic validation error - Path: %s - Method: %s - Errors: %d",
+        request.url.path, request.scope["method"], len(errors),
     )
     
     return create_error_response(
@@ -129,9 +123,10 @@ async def pydantic_validation_exception_handler(request, exc):
 
 async def general_exception_handler(request, exc):
     """Handle unexpected server errors"""
-    logger.error(
-        f"Unexpected error: {type(exc).__name__}: {str(exc)} - Path: {request.url} - Method: {request.method}",
-        exc_info=True
+    _log_error(
+        "Unexpected error: %s: %s - Path: %s - Method: %s",
+        type(exc).__name__, exc, request.url.path, request.scope["method"],
+        exc_info=_want_traceback(type(exc))
     )
     
     return create_error_response(
@@ -2,8 +2,101 @@
 Example payloads for API documentation and testing
 """
 
+from copy import deepcopy
 from typing import Dict, Any
-import json
+
+import orjson
+
+# Examples are built once at import; the getters hand out deep copies so a
+# caller mutating its example cannot change the OpenAPI docs or later calls.
+
+_QUOTE_EXAMPLE = {
+    "source": "SureStrat",  # Note: Case sensitive, must be "SureStrat" not "Surestrat"
+    "externalReferenceId": "12345678910",  # Match Postman collection example
+    "agentEmail": "agent@email.com",
+    "agentBranch": "lenasiaHO",
+    "vehicles": [
+        {
+            "year": 2019,
+            "make": "Volkswagen",
+            "model": "Polo Tsi 1.2 Comfortline",
+            "mmCode": "00815170",
+            "modified": "N",
+            "category": "HB",
+            "colour": "White",
+            "engineSize": 1.2,
+            "financed": "N",
+            "owner": "Y",
+            "status": "New",
+            "partyIsRegularDriver": "Y",
+            "accessories": "Y",
+            "accessoriesAmount": 20000,
+            "retailValue": 200000,
+            "marketValue": 180000,
+            "insuredValueType": "Retail",
+            "useType": "Private",
+            "overnightParkingSituation": "Garage",
+            "coverCode": "Comprehensive",
+            "address": {
+                "addressLine": "123 Main Street",
+                "postalCode": 2196,
+                "suburb": "Sandton",
+                "latitude": -26.10757,
+                "longitude": 28.0567,
+            },
+            "regularDriver": {
+                "maritalStatus": "Married",
+                "currentlyInsured": True,
+                "yearsWithoutClaims": 0,
+                "relationToPolicyHolder": "Self",
+                "emailAddress": "example@gmail.com",
+                "mobileNumber": "0821234567",
+                "idNumber": "9404054800086",
+                "prvInsLosses": 0,
+                "licenseIssueDate": "2018-10-02",
+                "dateOfBirth": "1994-04-05",
+            },
+        }
+    ],
+}
+
+_TRANSFER_EXAMPLE = {
+    "customer_info": {
+        "first_name": "Peter",
+        "last_name": "Smith",
+        "email": "peterSmith007@pineapple.co.za",
+        "contact_number": "0737111119",
+        "id_number": "9510025800086",
+        "quote_id": "67977c1c4130345e85bb7572"
+    },
+    "agent_info": {
+        "agent_email": "john.doe@surestrat.co.za",
+        "branch_name": "Sandton",
+    },
+}
+
+_TRANSFER_RESPONSE_EXAMPLE = {
+    "uuid": "12345678-1234-5678-1234-567812345678",
+    "redirect_url": "https://portal.pineapple.co.za/quote/12345678-1234-5678-1234-567812345678"
+}
+
+_TRANSFER_ERROR_EXAMPLE = {
+    "detail": "Failed to transfer lead to Pineapple API: Invalid customer information"
+}
+
+_QUOTE_RESPONSE_EXAMPLE = {
+    "premium": 1250.75,
+    "excess": 3500.00,
+    "quoteId": "QUO-2024-001234"
+}
+
+_QUOTE_ERROR_EXAMPLE = {
+    "detail": "Failed to get quote from Pineapple API: Invalid vehicle data"
+}
+
+_QUOTE_JSON = orjson.dumps(_QUOTE_EXAMPLE).decode()
+
+_TRANSFER_JSON = orjson.dumps(_TRANSFER_EXAMPLE).decode()
 
 
 def get_quote_example() -> Dict[str, Any]:
@@ -13,55 +106,7 @@ def get_quote_example() -> Dict[str, Any]:
     This shows the complete structure expected by the API, including all optional fields.
     The externalReferenceId is used for tracking quotes across systems.
     """
-    return {
-        "source": "SureStrat",  # Note: Case sensitive, must be "SureStrat" not "Surestrat"
-        "externalReferenceId": "12345678910",  # Match Postman collection example
-        "agentEmail": "agent@email.com",
-        "agentBranch": "lenasiaHO",
-        "vehicles": [
-            {
-                "year": 2019,
-                "make": "Volkswagen",
-                "model": "Polo Tsi 1.2 Comfortline",
-                "mmCode": "00815170",
-                "modified": "N",
-                "category": "HB",
-                "colour": "White",
-                "engineSize": 1.2,
-                "financed": "N",
-                "owner": "Y",
-                "status": "New",
-                "partyIsRegularDriver": "Y",
-                "accessories": "Y",
-                "accessoriesAmount": 20000,
-                "retailValue": 200000,
-                "marketValue": 180000,
-                "insuredValueType": "Retail",
-                "useType": "Private",
-                "overnightParkingSituation": "Garage",
-                "coverCode": "Comprehensive",
-                "address": {
-                    "addressLine": "123 Main Street",
-                    "postalCode": 2196,
-                    "suburb": "Sandton",
-                    "latitude": -26.10757,
-                    "longitude": 28.0567,
-                },
-                "regularDriver": {
-                    "maritalStatus": "Married",
-                    "currentlyInsured": True,
-                    "yearsWithoutClaims": 0,
-                    "relationToPolicyHolder": "Self",
-                    "emailAddress": "example@gmail.com",
-                    "mobileNumber": "0821234567",
-                    "idNumber": "9404054800086",
-                    "prvInsLosses": 0,
-                    "licenseIssueDate": "2018-10-02",
-                    "dateOfBirth": "1994-04-05",
-                },
-            }
-        ],
-    }
+    return deepcopy(_QUOTE_EXAMPLE)
 
 
 def get_transfer_example() -> Dict[str, Any]:
@@ -71,20 +116,7 @@ def get_transfer_example() -> Dict[str, Any]:
     Shows the complete structure for transferring a lead to Pineapple,
     including customer and agent information.
     """
-    return {
-        "customer_info": {
-            "first_name": "Peter",
-            "last_name": "Smith",
-            "email": "peterSmith007@pineapple.co.za",
-            "contact_number": "0737111119",
-            "id_number": "9510025800086",
-            "quote_id": "67977c1c4130345e85bb7572"
-        },
-        "agent_info": {
-            "agent_email": "john.doe@surestrat.co.za",
-            "branch_name": "Sandton",
-        },
-    }
+    return deepcopy(_TRANSFER_EXAMPLE)
 
 
 def get_transfer_response_example() -> Dict[str, Any]:
@@ -93,10 +125,7 @@ def get_transfer_response_example() -> Dict[str, Any]:
 
     Follows the TransferResponse schema for Swagger documentation.
     """
-    return {
-        "uuid": "12345678-1234-5678-1234-567812345678",
-        "redirect_url": "https://portal.pineapple.co.za/quote/12345678-1234-5678-1234-567812345678"
-    }
+    return deepcopy(_TRANSFER_RESPONSE_EXAMPLE)
 
 
 def get_transfer_error_example() -> Dict[str, Any]:
@@ -105,9 +134,7 @@ def get_transfer_error_example() -> Dict[str, Any]:
 
     Shows the actual error format returned by the API.
     """
-    return {
-        "detail": "Failed to transfer lead to Pineapple API: Invalid customer information"
-    }
+    return deepcopy(_TRANSFER_ERROR_EXAMPLE)
 
 
 def get_quote_response_example() -> Dict[str, Any]:
@@ -116,11 +143,7 @@ def get_quote_response_example() -> Dict[str, Any]:
 
     Follows the QuoteResponse schema for Swagger documentation.
     """
-    return {
-        "premium": 1250.75,
-        "excess": 3500.00,
-        "quoteId": "QUO-2024-001234"
-    }
+    return deepcopy(_QUOTE_RESPONSE_EXAMPLE)
 
 
 def get_quote_error_example() -> Dict[str, Any]:
@@ -129,16 +152,14 @@ def get_quote_error_example() -> Dict[str, Any]:
 
     Shows the actual error format returned by the API.
     """
-    return {
-        "detail": "Failed to get quote from Pineapple API: Invalid vehicle data"
-    }
+    return deepcopy(_QUOTE_ERROR_EXAMPLE)
 
 
 def get_quote_json_string_example() -> str:
     """Returns the quick quote example as a properly formatted JSON string"""
-    return json.dumps(get_quote_example())
+    return _QUOTE_JSON
 
 
 def get_transfer_json_string_example() -> str:
     """Returns the transfer example as a properly formatted JSON string"""
-    return json.dumps(get_transfer_example())
+    return _TRANSFER_JSON
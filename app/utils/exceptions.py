@@ -1,9 +1,16 @@
 """
 Custom exception classes for structured error handling
 """
+from datetime import datetime
 from typing import Dict, Any, Optional
 from fastapi import HTTPException
 
+# English month names, indexed by month - 1; avoids locale-dependent strftime
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
 
 class APIError(HTTPException):
     """Base custom API error with structured response"""
@@ -16,81 +23,74 @@ class APIError(HTTPException):
         user_message: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None
     ):
+        # Fields are kept as plain attributes for api_error_handler; detail is
+        # just the technical message
         self.error_code = error_code
+        self.message = message
         self.user_message = user_message or message
         self.details = details or {}
         
+        super().__init__(status_code=status_code, detail=message)
+
+
+class _FixedAPIError(APIError):
+    """
+    APIError whose status, code and user-facing message are fixed by the
+    subclass; instances only take the technical message and optional details.
+    """
+    status_code: int = 500
+    error_code: str = "API_ERROR"
+    user_message: str = ""
+    message_prefix: str = ""
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
-            status_code=status_code,
-            detail={
-                "error_code": error_code,
-                "message": message,
-                "user_message": self.user_message,
-                "details": self.details
-            }
+            status_code=self.status_code,
+            error_code=self.error_code,
+            message=f"{self.message_prefix}{message}",
+            user_message=self.user_message,
+            details=details,
         )
 
 
 # Quote-specific errors
-class QuoteValidationError(APIError):
+class QuoteValidationError(_FixedAPIError):
     """Raised when quote request validation fails"""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            status_code=400,
-            error_code="QUOTE_VALIDATION_ERROR",
-            message=message,
-            user_message="Please check your quote details and try again.",
-            details=details
-        )
+    status_code = 400
+    error_code = "QUOTE_VALIDATION_ERROR"
+    user_message = "Please check your quote details and try again."
 
 
-class QuoteStorageError(APIError):
+class QuoteStorageError(_FixedAPIError):
     """Raised when quote cannot be stored in database"""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            status_code=500,
-            error_code="QUOTE_STORAGE_ERROR",
-            message=f"Database error: {message}",
-            user_message="Unable to save your quote request. Please try again.",
-            details=details
-        )
+    status_code = 500
+    error_code = "QUOTE_STORAGE_ERROR"
+    user_message = "Unable to save your quote request. Please try again."
+    message_prefix = "Database error: "
 
 
-class QuoteAPIError(APIError):
+class QuoteAPIError(_FixedAPIError):
     """Raised when Pineapple quote API fails"""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            status_code=502,
-            error_code="QUOTE_API_ERROR",
-            message=f"Pineapple API error: {message}",
-            user_message="Unable to process your quote request. Please try again later.",
-            details=details
-        )
+    status_code = 502
+    error_code = "QUOTE_API_ERROR"
+    user_message = "Unable to process your quote request. Please try again later."
+    message_prefix = "Pineapple API error: "
 
 
-class QuoteResponseError(APIError):
+class QuoteResponseError(_FixedAPIError):
     """Raised when quote response cannot be parsed or stored"""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            status_code=502,
-            error_code="QUOTE_RESPONSE_ERROR", 
-            message=f"Invalid response: {message}",
-            user_message="Received invalid response from quote service. Please try again.",
-            details=details
-        )
+    status_code = 502
+    error_code = "QUOTE_RESPONSE_ERROR"
+    user_message = "Received invalid response from quote service. Please try again."
+    message_prefix = "Invalid response: "
 
 
 # Transfer-specific errors
-class TransferValidationError(APIError):
+class TransferValidationError(_FixedAPIError):
     """Raised when transfer request validation fails"""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            status_code=400,
-            error_code="TRANSFER_VALIDATION_ERROR",
-            message=message,
-            user_message="Please check your transfer details and try again.",
-            details=details
-        )
+    status_code = 400
+    error_code = "TRANSFER_VALIDATION_ERROR"
+    user_message = "Please check your transfer details and try again."
 
 
 class TransferDuplicateError(APIError):
@@ -98,13 +98,15 @@ class TransferDuplicateError(APIError):
     def __init__(self, submission_date: str, transfer_id: str, matched_field: str, source: str = "database"):
         # Format the date for better readability
         try:
-            from datetime import datetime
             if "T" in submission_date:
                 dt = datetime.fromisoformat(submission_date.replace("Z", "+00:00"))
-                formatted_date = dt.strftime("%B %d, %Y at %H:%M UTC")
+                formatted_date = (
+                    f"{_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year} "
+                    f"at {dt.hour:02d}:{dt.minute:02d} UTC"
+                )
             else:
                 formatted_date = submission_date
-        except:
+        except (TypeError, ValueError):
             formatted_date = submission_date
             
         super().__init__(
@@ -123,53 +125,37 @@ class TransferDuplicateError(APIError):
         )
 
 
-class TransferStorageError(APIError):
+class TransferStorageError(_FixedAPIError):
     """Raised when transfer cannot be stored in database"""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            status_code=500,
-            error_code="TRANSFER_STORAGE_ERROR",
-            message=f"Database error: {message}",
-            user_message="Unable to save your transfer request. Please try again.",
-            details=details
-        )
+    status_code = 500
+    error_code = "TRANSFER_STORAGE_ERROR"
+    user_message = "Unable to save your transfer request. Please try again."
+    message_prefix = "Database error: "
 
 
-class TransferAPIError(APIError):
+class TransferAPIError(_FixedAPIError):
     """Raised when Pineapple transfer API fails"""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            status_code=502,
-            error_code="TRANSFER_API_ERROR",
-            message=f"Pineapple API error: {message}",
-            user_message="Unable to process your transfer request. Please try again later.",
-            details=details
-        )
+    status_code = 502
+    error_code = "TRANSFER_API_ERROR"
+    user_message = "Unable to process your transfer request. Please try again later."
+    message_prefix = "Pineapple API error: "
 
 
-class TransferResponseError(APIError):
+class TransferResponseError(_FixedAPIError):
     """Raised when transfer response cannot be parsed or stored"""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            status_code=502,
-            error_code="TRANSFER_RESPONSE_ERROR",
-            message=f"Invalid response: {message}",
-            user_message="Received invalid response from transfer service. Please try again.",
-            details=details
-        )
+    status_code = 502
+    error_code = "TRANSFER_RESPONSE_ERROR"
+    user_message = "Received invalid response from transfer service. Please try again."
+    message_prefix = "Invalid response: "
 
 
 # General system errors
-class DatabaseError(APIError):
+class DatabaseError(_FixedAPIError):
     """Raised for general database errors"""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            status_code=500,
-            error_code="DATABASE_ERROR",
-            message=f"Database error: {message}",
-            user_message="A database error occurred. Please try again later.",
-            details=details
-        )
+    status_code = 500
+    error_code = "DATABASE_ERROR"
+    user_message = "A database error occurred. Please try again later."
+    message_prefix = "Database error: "
 
 
 class ExternalServiceError(APIError):
@@ -184,13 +170,9 @@ class ExternalServiceError(APIError):
         )
 
 
-class EmailError(APIError):
+class EmailError(_FixedAPIError):
     """Raised when email sending fails"""
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(
-            status_code=500,
-            error_code="EMAIL_ERROR",
-            message=f"Email service error: {message}",
-            user_message="Notification email could not be sent, but your request was processed successfully.",
-            details=details
-        )
+    status_code = 500
+    error_code = "EMAIL_ERROR"
+    user_message = "Notification email could not be sent, but your request was processed successfully."
+    message_prefix = "Email service error: "
@@ -0,0 +1,51 @@
+"""
+Shared httpx client for outbound API calls
+"""
+from typing import Optional
+
+import httpx
+
+from app.utils.rich_logger import get_rich_logger
+from config.settings import settings
+
+logger = get_rich_logger("http_client")
+
+# Headers for every Pineapple call. The credentials are fixed for the life of
+# the process, so the Authorization value is encoded once; httpx merges this
+# mapping into each request without mutating it.
+PINEAPPLE_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": settings.PINEAPPLE_AUTH_HEADER.encode("ascii"),
+}
+
+logger.info(
+    "Pineapple authorization: Bearer KEY=%s...%s SECRET=***",
+    settings.PINEAPPLE_API_KEY[:5],
+    settings.PINEAPPLE_API_KEY[-3:],
+)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide AsyncClient, creating it on first use.
+    Reusing one client keeps connections to Pineapple alive between requests.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        logger.info("Shared HTTP client initialized")
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient (called on application shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Shared HTTP client closed")
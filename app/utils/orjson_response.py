@@ -0,0 +1,16 @@
+"""
+JSON response class backed by orjson
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson instead of the stdlib json module"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
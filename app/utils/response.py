@@ -1,9 +1,28 @@
 """
 Response wrapper utilities for consistent API responses
 """
+import time
 from datetime import datetime
 from typing import Any, Dict, Union, Optional
-from fastapi.responses import JSONResponse
+
+import orjson
+from fastapi.responses import Response
+
+# Shared empty "details" value; only ever serialized, never mutated
+_EMPTY: Dict[str, Any] = {}
+
+# (epoch second, ISO string) of the last formatted timestamp
+_ts_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, reformatted at most once per second"""
+    t = int(time.time())
+    cache = _ts_cache
+    if cache[0] != t:
+        cache[1] = datetime.fromtimestamp(t).isoformat()
+        cache[0] = t
+    return cache[1]
 
 
 def success_response(data: Any, status_code: int = 200) -> Dict[str, Any]:
@@ -11,7 +30,7 @@ def success_response(data: Any, status_code: int = 200) -> Dict[str, Any]:
     return {
         "success": True,
         "data": data,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
@@ -21,18 +40,20 @@ def error_response(
     user_message: Optional[str] = None,
     details: Optional[Dict[str, Any]] = None,
     status_code: int = 500
-) -> JSONResponse:
-    """Create a standardized error response"""
-    return JSONResponse(
-        status_code=status_code,
-        content={
+) -> Response:
+    """Create a standardized error response, serialized straight to bytes"""
+    body = orjson.dumps(
+        {
             "success": False,
             "error": {
                 "code": error_code,
                 "message": user_message or message,
                 "technical_message": message,
-                "details": details or {}
+                "details": details or _EMPTY
             },
-            "timestamp": datetime.now().isoformat()
-        }
+            "timestamp": _now_iso()
+        },
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS,
     )
+    return Response(content=body, media_type="application/json", status_code=status_code)
@@ -1,25 +1,43 @@
 from rich.logging import RichHandler
+from functools import lru_cache
 import logging
 import sys
 
+from config.settings import settings
+
+_LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
 
 def setup_rich_logging(level=logging.INFO):
     """
     Sets up logging with RichHandler for pretty console output.
     Call this early in your app (e.g. main.py or __init__.py).
+    In production a plain StreamHandler is used instead, since Rich's rendering
+    costs far more per record than writing a formatted line.
     """
+    # No format string uses thread/process fields; skip collecting them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    if settings.IS_PRODUCTION:
+        handler = logging.StreamHandler(sys.stdout)
+    else:
+        handler = RichHandler(rich_tracebacks=True, show_time=False, show_level=True, show_path=True)
     logging.basicConfig(
         level=level,
-        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+        format=_LOG_FORMAT,
         datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[RichHandler(rich_tracebacks=True, show_time=False, show_level=True, show_path=True)],
+        handlers=[handler],
         force=True,
     )
 
 
+@lru_cache(maxsize=256)
 def get_rich_logger(name: str) -> logging.Logger:
     """
     Returns a logger instance with the given name, using RichHandler.
+    Lookups are memoized so repeat calls skip the logging manager lock.
     """
     return logging.getLogger(name)
 
@@ -3,9 +3,35 @@ from config.settings import settings
 from app.utils.rich_logger import get_rich_logger
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from functools import lru_cache
 
 logger = get_rich_logger("supabase")
 
+# Columns the duplicate check's callers read: the transfer id and submission date
+# for the error, plus normalized_id_number to tell which predicate matched
+_DUPLICATE_COLUMNS = "id, created_at, id_number, normalized_id_number"
+
+# Characters dropped from identifiers, removed in a single translate() pass
+_STRIP = str.maketrans("", "", " -+")
+
+
+def normalize_identifier(value: Optional[str]) -> str:
+    """
+    Canonical form of an ID or contact number for duplicate matching: spaces,
+    dashes and plus signs removed, lower-cased. Stored alongside the raw value
+    in the normalized_* columns so lookups can use plain indexed equality.
+    """
+    if not value:
+        return ""
+    return value.translate(_STRIP).strip().lower()
+
+
+def _or_value(value: str) -> str:
+    """Double-quote a value for a PostgREST or=() filter so commas/parentheses are literal"""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
 class SupabaseClient:
     def __init__(self):
         self.client: Client = create_client(
@@ -14,6 +40,24 @@ class SupabaseClient:
         )
         logger.info("Supabase client initialized")
 
+    def verify_normalized_columns(self) -> None:
+        """
+        Fail fast if the leads table predates add_normalized_identifier_columns.sql.
+        Inserts and duplicate checks both depend on the normalized_* columns.
+        """
+        try:
+            (
+                self.client.table(settings.TRANSFERS_TABLE)
+                .select("normalized_id_number, normalized_contact_number")
+                .limit(1)
+                .execute()
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"{settings.TRANSFERS_TABLE} is missing the normalized_* columns; run "
+                f"add_normalized_identifier_columns.sql before deploying ({str(e)})"
+            ) from e
+
     def create_document(self, table: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a new document in the specified table"""
         try:
@@ -29,14 +73,12 @@ class SupabaseClient:
     def update_document(self, table: str, document_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a document by ID"""
         try:
-            # Remove created_at if present (it's immutable)
-            if 'created_at' in data:
-                del data['created_at']
+            # Work on a copy so the caller's dict is left untouched; created_at is
+            # immutable and is dropped from the update
+            payload = {k: v for k, v in data.items() if k != 'created_at'}
+            payload['updated_at'] = datetime.utcnow().isoformat()
             
-            # Set updated_at to current timestamp
-            data['updated_at'] = datetime.utcnow().isoformat()
-            
-            response = self.client.table(table).update(data).eq('id', document_id).execute()
+            response = self.client.table(table).update(payload).eq('id', document_id).execute()
             if response.data:
                 logger.info(f"Document updated in {table}: {document_id}")
                 return response.data[0]
@@ -59,12 +101,7 @@ class SupabaseClient:
     def find_documents(self, table: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Find documents by filters"""
         try:
-            query = self.client.table(table).select("*")
-            
-            for field, value in filters.items():
-                query = query.eq(field, value)
-            
-            response = query.execute()
+            response = self.client.table(table).select("*").match(filters).execute()
             return response.data if response.data else []
         except Exception as e:
             logger.error(f"Error finding documents in {table}: {str(e)}")
@@ -73,31 +110,54 @@ class SupabaseClient:
     def check_duplicate_transfer(self, id_number: str, contact_number: str) -> Optional[Dict[str, Any]]:
         """Check for duplicate transfers by ID number or contact number"""
         try:
-            # Normalize the inputs
-            normalized_id = id_number.replace(" ", "").replace("-", "").replace("+", "") if id_number else ""
-            normalized_contact = contact_number.replace(" ", "").replace("-", "").replace("+", "") if contact_number else ""
+            # Normalize the inputs the same way store_transfer_request does
+            normalized_id = normalize_identifier(id_number)
+            normalized_contact = normalize_identifier(contact_number)
             
             logger.info(f"Checking for duplicates - ID: {normalized_id}, Contact: {normalized_contact}")
             
-            # Check by ID number first
+            conditions = []
             if normalized_id:
-                response = self.client.table('leads').select("*").ilike('id_number', f"%{normalized_id}%").execute()
-                if response.data and len(response.data) > 0:
-                    logger.info(f"Found duplicate transfer by ID number: {normalized_id}")
-                    return response.data[0]
-            
-            # Check by contact number
+                conditions.append("normalized_id_number.eq." + _or_value(normalized_id))
             if normalized_contact:
-                response = self.client.table('leads').select("*").ilike('contact_number', f"%{normalized_contact}%").execute()
-                if response.data and len(response.data) > 0:
-                    logger.info(f"Found duplicate transfer by contact number: {normalized_contact}")
-                    return response.data[0]
-            
+                conditions.append("normalized_contact_number.eq." + _or_value(normalized_contact))
+            if not conditions:
+                return None
+
+            # One indexed round-trip covers both predicates; an ID number match is preferred.
+            # Backfilled legacy rows can repeat an identifier, so no limit is applied:
+            # only a handful of narrow rows can match, and every one is needed to find
+            # an ID match that newer contact-number matches would otherwise crowd out.
+            response = (
+                self.client.table('leads')
+                .select(_DUPLICATE_COLUMNS)
+                .or_(",".join(conditions))
+                .order("created_at", desc=True)
+                .execute()
+            )
+            rows = response.data or []
+
+            if normalized_id:
+                for row in rows:
+                    if row.get("normalized_id_number") == normalized_id:
+                        logger.info(f"Found duplicate transfer by ID number: {normalized_id}")
+                        return row
+
+            if rows:
+                logger.info(f"Found duplicate transfer by contact number: {normalized_contact}")
+                return rows[0]
+
             logger.info("No duplicate transfer found")
             return None
         except Exception as e:
             logger.error(f"Error checking for duplicate transfer: {str(e)}")
             raise
 
-# Global instance
-supabase_client = SupabaseClient()
+@lru_cache(maxsize=1)
+def get_supabase_client() -> SupabaseClient:
+    """
+    Shared SupabaseClient, created on first use rather than at import so the
+    module loads without credentials. get_supabase_client.cache_clear() forces
+    a fresh client (e.g. after rotating the service key).
+    """
+    return SupabaseClient()
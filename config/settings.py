@@ -1,4 +1,5 @@
 import os
+from functools import cached_property
 from dotenv import load_dotenv
 from pathlib import Path
 from pydantic_settings import BaseSettings
@@ -17,6 +18,13 @@ TEMPLATES_DIR: Path = BASE_DIR / "templates"
 #     return [item.strip() for item in value.split(",") if item.strip()]
 
 
+def _split_csv(value: Optional[str]) -> tuple[str, ...]:
+    """Split a comma-separated setting into its non-empty, stripped items"""
+    if not value:
+        return ()
+    return tuple(item for part in value.split(",") if (item := part.strip()))
+
+
 class Settings(BaseSettings):
     """Application settings."""
 
@@ -89,6 +97,15 @@ class Settings(BaseSettings):
     ADMIN_CC_EMAILS: str = os.getenv("ADMIN_CC_EMAILS", "")
     ADMIN_BCC_EMAILS: str = os.getenv("ADMIN_BCC_EMAILS", "")
 
+    # Parsed forms of the comma-separated settings, split once on first use
+    @cached_property
+    def ADMIN_EMAILS_LIST(self) -> tuple[str, ...]:
+        return _split_csv(self.ADMIN_EMAILS)
+
+    @cached_property
+    def ADMIN_BCC_EMAILS_LIST(self) -> tuple[str, ...]:
+        return _split_csv(self.ADMIN_BCC_EMAILS)
+
     # External API - Pineapple credentials {bearer_token}
     # Test credentials
     PINEAPPLE_TEST_API_KEY: str = os.getenv("PINEAPPLE_TEST_API_KEY", "")
@@ -98,8 +115,9 @@ class Settings(BaseSettings):
     PINEAPPLE_PROD_API_KEY: str = os.getenv("PINEAPPLE_PROD_API_KEY", "")
     PINEAPPLE_PROD_API_SECRET: str = os.getenv("PINEAPPLE_PROD_API_SECRET", "")
 
-    # Dynamic credential selection based on environment
-    @property
+    # Dynamic credential selection based on environment (resolved once; the
+    # environment does not change while the process runs)
+    @cached_property
     def PINEAPPLE_API_KEY(self) -> str:
         return (
             self.PINEAPPLE_PROD_API_KEY
@@ -107,7 +125,7 @@ class Settings(BaseSettings):
             else self.PINEAPPLE_TEST_API_KEY
         )
 
-    @property
+    @cached_property
     def PINEAPPLE_API_SECRET(self) -> str:
         return (
             self.PINEAPPLE_PROD_API_SECRET
@@ -115,11 +133,16 @@ class Settings(BaseSettings):
             else self.PINEAPPLE_TEST_API_SECRET
         )
 
+    @cached_property
+    def PINEAPPLE_AUTH_HEADER(self) -> str:
+        # Authorization header value exactly as in the Postman collection
+        return f"Bearer KEY={self.PINEAPPLE_API_KEY} SECRET={self.PINEAPPLE_API_SECRET}"
+
     # External API - Pineapple endpoints
     PINEAPPLE_TEST_BASE_URL: str = "http://gw-test.pineapple.co.za"
     PINEAPPLE_PROD_BASE_URL: str = "http://gw.pineapple.co.za"
 
-    @property
+    @cached_property
     def PINEAPPLE_BASE_URL(self) -> str:
         return (
             self.PINEAPPLE_PROD_BASE_URL
@@ -131,11 +154,11 @@ class Settings(BaseSettings):
     PINEAPPLE_TRANSFER_PATH: str = "/users/motor_lead"
     PINEAPPLE_QUOTE_PATH: str = "/api/v1/quote/quick-quote"
 
-    @property
+    @cached_property
     def PINEAPPLE_TRANSFER_API_URL(self) -> str:
         return f"{self.PINEAPPLE_BASE_URL}{self.PINEAPPLE_TRANSFER_PATH}"
 
-    @property
+    @cached_property
     def PINEAPPLE_QUOTE_API_URL(self) -> str:
         return f"{self.PINEAPPLE_BASE_URL}{self.PINEAPPLE_QUOTE_PATH}"
 
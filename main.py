@@ -1,6 +1,8 @@
 from app.utils.rich_logger import setup_rich_logging
 from config.settings import settings
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 setup_rich_logging()
@@ -11,20 +13,36 @@ from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from app.api.v1.endpoints import quote, transfer
 from app.utils.exceptions import APIError
+from app.utils.orjson_response import ORJSONResponse
+from app.utils.http_client import close_http_client
+from app.utils.supabase import get_supabase_client
 from app.utils.error_handlers import (
     api_error_handler,
     validation_exception_handler,
     pydantic_validation_exception_handler,
     general_exception_handler
 )
-from starlette.middleware.base import BaseHTTPMiddleware
 
 logger = logging.getLogger("pine-api")
 
 # Simple CORS configuration - allow all origins
 logger.info("Starting with CORS enabled for all origins (*)")
 
-app = FastAPI(title="Pineapple Surestrat API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Refuse to serve transfers against a schema without the normalized columns
+    await asyncio.to_thread(get_supabase_client().verify_normalized_columns)
+    yield
+    # Release pooled connections to Pineapple on shutdown
+    await close_http_client()
+
+
+app = FastAPI(
+    title="Pineapple Surestrat API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Register exception handlers
 app.add_exception_handler(APIError, api_error_handler)
@@ -39,6 +57,7 @@ app.add_middleware(
     allow_credentials=False,  # Must be False when allow_origins is ["*"]
     allow_methods=["*"],  # Allow all methods
     allow_headers=["*"],  # Allow all headers
+    max_age=86400,  # Let browsers cache preflights (they clamp to their own maximum)
 )
 
 # Include routers
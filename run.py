@@ -49,13 +49,33 @@ if __name__ == "__main__":
         logger = logging.getLogger("Pineapple-surestrat-api")
         logger.info("Starting Pineapple-surestrat-api...")
 
+        # The file watcher is for development only. Use the app's own production
+        # flag so the server mode always matches the credentials and logging in use.
+        from config.settings import settings
+
+        reload = not settings.IS_PRODUCTION
+
+        # uvicorn cannot combine reload with multiple workers, so the worker
+        # count only applies without reload. The default stays small: cpu_count()
+        # reports the host's cores inside containers, and every worker holds its
+        # own Supabase/HTTP/SMTP clients and duplicate cache. Scale with
+        # WEB_CONCURRENCY.
+        worker_options = {}
+        if not reload:
+            worker_options["workers"] = int(os.environ.get("WEB_CONCURRENCY", 2))
+
         uvicorn.run(
             "main:app",
             host="0.0.0.0",
             port=int(os.environ.get("PORT", 4000)),
-            reload=True,
+            # "auto" picks uvloop/httptools (from uvicorn[standard]) when they are
+            # installed and falls back to asyncio/h11 where they are not (e.g. Windows)
+            loop="auto",
+            http="auto",
+            reload=reload,
             log_level=str(os.environ.get("LOG_LEVEL", "debug")).lower(),
             log_config=None,
+            **worker_options,
         )
     except Exception as e:
         print(f"An error occurred while starting the server: {e}")
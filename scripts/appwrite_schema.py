@@ -44,11 +44,15 @@ def init_transfer_schema(db, database_id, transfer_collection_id):
         log_and_create_attribute(db.create_string_attribute, database_id, transfer_collection_id, key="redirect_url", size=255, required=False)
         log_and_create_attribute(db.create_string_attribute, database_id, transfer_collection_id, key="agent_email", size=255, required=True)
         log_and_create_attribute(db.create_string_attribute, database_id, transfer_collection_id, key="branch_name", size=30, required=True)
+        log_and_create_attribute(db.create_string_attribute, database_id, transfer_collection_id, key="normalized_id_number", size=13, required=False)
+        log_and_create_attribute(db.create_string_attribute, database_id, transfer_collection_id, key="normalized_contact_number", size=15, required=False)
         log_and_create_attribute(db.create_index, database_id, transfer_collection_id, key="unique_email", type="unique", attributes=["email"])
         log_and_create_attribute(db.create_index, database_id, transfer_collection_id, key="unique_contact_number", type="unique", attributes=["contact_number"])
         log_and_create_attribute(db.create_index, database_id, transfer_collection_id, key="unique_id_number", type="unique", attributes=["id_number"])
         log_and_create_attribute(db.create_index, database_id, transfer_collection_id, key="idx_email", type="fulltext", attributes=["email"])
         log_and_create_attribute(db.create_index, database_id, transfer_collection_id, key="idx_contact_number", type="fulltext", attributes=["contact_number"])
+        log_and_create_attribute(db.create_index, database_id, transfer_collection_id, key="idx_normalized_id_number", type="key", attributes=["normalized_id_number"])
+        log_and_create_attribute(db.create_index, database_id, transfer_collection_id, key="idx_normalized_contact_number", type="key", attributes=["normalized_contact_number"])
         logging.info("Successfully initialized transfer attributes with unique constraints.")
     except Exception as e:
         logging.error(f"Error in init_transfer_schema: {e}")
@@ -21,13 +21,18 @@ CREATE TABLE leads (
   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
   updated_at TIMESTAMPTZ DEFAULT NOW(),
   agent_email TEXT,
-  imported_at TIMESTAMPTZ DEFAULT NOW()
+  imported_at TIMESTAMPTZ DEFAULT NOW(),
+  -- Canonical forms (no spaces/dashes/plus, lower-case) used for duplicate checks
+  normalized_id_number TEXT,
+  normalized_contact_number TEXT
 );
 
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_leads_email ON leads(email);
 CREATE INDEX IF NOT EXISTS idx_leads_id_number ON leads(id_number);
 CREATE INDEX IF NOT EXISTS idx_leads_contact_number ON leads(contact_number);
+CREATE INDEX IF NOT EXISTS idx_leads_normalized_id_number ON leads(normalized_id_number);
+CREATE INDEX IF NOT EXISTS idx_leads_normalized_contact_number ON leads(normalized_contact_number);
 CREATE INDEX IF NOT EXISTS idx_leads_created_at ON leads(created_at);
 CREATE INDEX IF NOT EXISTS idx_leads_branch ON leads(branch_name);
 CREATE INDEX IF NOT EXISTS idx_leads_agent ON leads(agent_name);